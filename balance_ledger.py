@@ -0,0 +1,146 @@
+# Local balance ledger seeded once and updated from the user-data stream
+
+import asyncio
+import random
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from config import STABLE
+from mexc_toolkit import mexc_account
+from subject import Subject
+from user_stream import ACCOUNT, DEALS, RECONNECTED, StreamObserver, UserDataStream
+
+'''
+mexc_account.get_account_info - полный подписанный запрос (плюс /time), который
+отдает все активы. BalanceLedger вызывает его один раз (seed), а дальше держит
+балансы в памяти по событиям потока:
+- spot@private.account.v3.api - абсолютные free/locked по активу;
+- сделки (spot@private.deals.v3.api) - только если apply_fills=True, для потоков
+  без канала баланса; иначе изменение пришло бы дважды. Это приближение:
+  сделка меняет free, блокировки под ордера не учитываются.
+После переподключения потока балансы помечаются невалидными и пересеиваются
+(при ошибке - повторы с экспоненциальной паузой, пока seed не пройдет).
+События, пришедшие во время seed, применяются после него - даже если он не удался.
+Только сделки после удачного seed не применяются: снимок мог их уже учесть.
+
+free()/locked()/balances() - O(1) из словаря, без сети. Пока балансы невалидны
+(до первого seed и после переподключения), они бросают StaleBalanceError.
+'''
+
+RESEED_BACKOFF = 1
+RESEED_MAX_BACKOFF = 60
+
+
+class StaleBalanceError(RuntimeError):
+    pass
+
+
+class BalanceObserver(ABC):
+    @abstractmethod
+    def balance_updated(self, asset: str, free: float, locked: float) -> None:
+        pass
+
+
+class BalanceLedger(Subject, StreamObserver):
+    notify_method = 'balance_updated'
+
+    def __init__(self, stream: UserDataStream, account: mexc_account, apply_fills: bool = False):
+        super().__init__()
+        self.__account = account
+        self.__apply_fills = apply_fills
+        self.__balances: Dict[str, List[float]] = {}
+        self.__buffer: Optional[List[Tuple[str, dict]]] = None
+        self.__reseed: Optional[asyncio.Task] = None
+        self.valid = False
+        stream.register_observer(self)
+
+    def __check_valid(self) -> None:
+        if not self.valid:
+            raise StaleBalanceError('Balance ledger is not seeded or was invalidated by reconnect')
+
+    def __balance(self, asset: str) -> List[float]:
+        return self.__balances.get(asset) or [0.0, 0.0]
+
+    def free(self, asset: str) -> float:
+        self.__check_valid()
+        return self.__balance(asset)[0]
+
+    def locked(self, asset: str) -> float:
+        self.__check_valid()
+        return self.__balance(asset)[1]
+
+    def balances(self) -> Dict[str, Tuple[float, float]]:
+        self.__check_valid()
+        return {asset: (free, locked) for asset, (free, locked) in self.__balances.items()}
+
+    async def seed(self) -> None:
+        self.__buffer = []
+        try:
+            info = await self.__account.get_account_info()
+            if 'balances' not in info:
+                raise RuntimeError(f'get_account_info failed: {info}')
+            self.__balances = {
+                balance['asset']: [float(balance['free']), float(balance['locked'])]
+                for balance in info['balances']
+            }
+            self.valid = True
+            logger.debug(f'Balance ledger seeded with {len(self.__balances)} assets')
+        finally:
+            # и при неудаче: события потока новее того, что есть в словаре, терять их нельзя.
+            # Но сделки - приращения, и удачный снимок мог их уже учесть
+            buffer, self.__buffer = self.__buffer, None
+            for channel, message in buffer:
+                if channel == DEALS and self.valid:
+                    continue
+                self.stream_event(channel, message)
+
+    async def __reseed_safely(self) -> None:
+        delay = RESEED_BACKOFF
+        while not self.valid:
+            try:
+                await self.seed()
+            except Exception as e:
+                logger.error(f'Balance ledger reseed failed: {e!r}, retry in {delay:.1f}s')
+                await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+                delay = min(delay * 2, RESEED_MAX_BACKOFF)
+
+    def __set(self, asset: str, free: float, locked: float) -> None:
+        self.__balances[asset] = [free, locked]
+        self.notify_observers(asset, free, locked)
+
+    def stream_event(self, channel: str, message: Optional[dict]) -> None:
+        if channel == RECONNECTED:
+            self.valid = False
+            logger.warning('Balance ledger invalidated by reconnect, reseeding')
+            if self.__reseed is None or self.__reseed.done():
+                self.__reseed = asyncio.get_running_loop().create_task(self.__reseed_safely())
+            return
+        if channel not in (ACCOUNT, DEALS):
+            return
+        if self.__buffer is not None:
+            self.__buffer.append((channel, message))
+            return
+        data = message['d']
+        if channel == ACCOUNT:
+            self.__set(data['a'], float(data['f']), float(data['l']))
+        elif self.__apply_fills:
+            self.__on_fill(message['s'], data)
+
+    def __on_fill(self, symbol: str, data: dict) -> None:
+        # Разбор пары возможен только для котировок в STABLE (BTCUSDT -> BTC / USDT)
+        if not symbol.endswith(STABLE):
+            return
+        base = symbol[:-len(STABLE)]
+        qty = float(data['v'])
+        quote_qty = qty * float(data['p'])
+        sign = 1 if data.get('S') == 1 else -1
+        free, locked = self.__balance(base)
+        self.__set(base, free + sign * qty, locked)
+        free, locked = self.__balance(STABLE)
+        self.__set(STABLE, free - sign * quote_qty, locked)
+        fee_asset = data.get('N')
+        if fee_asset and data.get('n'):
+            free, locked = self.__balance(fee_asset)
+            self.__set(fee_asset, free - float(data['n']), locked)
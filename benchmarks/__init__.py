@@ -0,0 +1 @@
+# Benchmarks (asv-style: time_*, track_*, peakmem_*)
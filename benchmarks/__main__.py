@@ -0,0 +1,58 @@
+# Minimal runner for the asv-style benchmarks: python -m benchmarks [filter]
+
+import importlib
+import inspect
+import itertools
+import pkgutil
+import sys
+import timeit
+
+import benchmarks
+
+
+def iter_benchmarks(pattern: str = ''):
+    for module_info in pkgutil.iter_modules(benchmarks.__path__):
+        if not module_info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module(f'benchmarks.{module_info.name}')
+        for class_name, cls in inspect.getmembers(module, inspect.isclass):
+            if class_name.startswith('_') or cls.__module__ != module.__name__:
+                continue
+            for name in dir(cls):
+                if name.startswith(('time_', 'track_')):
+                    full_name = f'{module_info.name}.{class_name}.{name}'
+                    if pattern in full_name:
+                        yield full_name, cls, name
+
+
+def run(full_name, cls, name) -> None:
+    params = getattr(cls, 'params', [])
+    if params and not isinstance(params[0], (list, tuple)):
+        params = [params]
+    for combo in itertools.product(*params):
+        bench = cls()
+        if hasattr(bench, 'setup'):
+            bench.setup(*combo)
+        try:
+            method = getattr(bench, name)
+            if name.startswith('time_'):
+                number, _ = timeit.Timer(lambda: method(*combo)).autorange()
+                best = min(timeit.Timer(lambda: method(*combo)).repeat(repeat=3, number=number)) / number
+                result = f'{best * 1e6:12.2f} us'
+            else:
+                result = f'{method(*combo):12.2f} {getattr(method, "unit", "")}'
+        finally:
+            if hasattr(bench, 'teardown'):
+                bench.teardown(*combo)
+        label = f'{full_name}({", ".join(map(repr, combo))})' if combo else full_name
+        print(f'{label:<70} {result}')
+
+
+def main() -> None:
+    pattern = sys.argv[1] if len(sys.argv) > 1 else ''
+    for full_name, cls, name in iter_benchmarks(pattern):
+        run(full_name, cls, name)
+
+
+if __name__ == '__main__':
+    main()
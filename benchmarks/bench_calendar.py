@@ -0,0 +1,85 @@
+# Loading, scheduling and hot-reloading a large listing calendar
+
+import asyncio
+import datetime as dt
+import os
+import random
+import tempfile
+
+from listing_calendar import load_calendar
+from listing_runtime import ListingRuntime
+from try_mexc import PriceListener
+
+
+def write_calendar(path: str, listings: int, seed: int = 1) -> None:
+    '''
+    listings будущих листингов, у трети - переопределения, у десятой части - ордер.
+    '''
+    rnd = random.Random(seed)
+    start = dt.datetime.now() + dt.timedelta(days=1)
+    with open(path, 'w') as f:
+        f.write('token,listing,duration,cadence,timeout,order_amount,order_price\n')
+        for i in range(listings):
+            listing = (start + dt.timedelta(seconds=rnd.randrange(30 * 24 * 3600))).replace(microsecond=0)
+            overrides = f'{rnd.randint(30, 600)},{rnd.choice((0.2, 0.5, 1))},0.3' if i % 3 == 0 else ',,'
+            order = f'{rnd.randint(10, 100)},' if i % 10 == 0 else ','
+            f.write(f'T{i},{listing.isoformat(" ")},{overrides},{order}\n')
+
+
+async def _make_runtime(path: str, trade=None) -> ListingRuntime:
+    # AsyncIOScheduler стартует только внутри работающего цикла
+    return ListingRuntime(PriceListener(hosts='http://127.0.0.1'), path, trade=trade)
+
+
+async def _shutdown(runtime: ListingRuntime) -> None:
+    runtime.listener.scheduler.shutdown(wait=False)
+
+
+class _Calendar:
+    params = [1000, 10000]
+    param_names = ['listings']
+
+    def setup(self, listings):
+        fd, self.path = tempfile.mkstemp(suffix='.csv')
+        os.close(fd)
+        write_calendar(self.path, listings)
+        self.loop = asyncio.new_event_loop()
+        # trade нужен только чтобы ставились задачи ордеров - в бенчмарке они не срабатывают
+        self.runtime = self.loop.run_until_complete(_make_runtime(self.path, trade=object()))
+
+    def teardown(self, listings):
+        self.loop.run_until_complete(_shutdown(self.runtime))
+        self.loop.close()
+        os.unlink(self.path)
+
+
+class CalendarLoad(_Calendar):
+    def time_parse_and_validate(self, listings):
+        load_calendar(self.path)
+
+    def time_schedule_all(self, listings):
+        # первый load: пачка задач на пустой планировщик
+        listener = self.runtime.listener
+        listener.scheduler.remove_all_jobs()
+        ListingRuntime(listener, self.path, trade=object()).load()
+
+    def track_jobs(self, listings):
+        self.runtime.load()
+        return len(self.runtime.listener.scheduler.get_jobs())
+    track_jobs.unit = 'jobs'
+
+
+class CalendarReload(_Calendar):
+    def setup(self, listings):
+        super().setup(listings)
+        self.runtime.load()
+
+    def time_reload_unchanged(self, listings):
+        self.runtime.reload()
+
+    def track_jobs_recreated(self, listings):
+        before = {job.id: job for job in self.runtime.listener.scheduler.get_jobs()}
+        self.runtime.reload()
+        after = self.runtime.listener.scheduler.get_jobs()
+        return sum(1 for job in after if before.get(job.id) is not job)
+    track_jobs_recreated.unit = 'jobs'
@@ -0,0 +1,50 @@
+# Import time of the toolkit and the scripts, measured in a fresh interpreter
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+STATEMENTS = {
+    'market_only': 'from mexc_toolkit import mexc_market',
+    'all_clients': 'from mexc_toolkit import ' + ', '.join((
+        'mexc_market', 'mexc_trade', 'mexc_account', 'mexc_capital',
+        'mexc_subaccount', 'mexc_rebate', 'mexc_listenkey',
+    )),
+    'try_mexc': 'import try_mexc',
+    'sandbox': 'import sandbox',
+}
+
+
+def import_time(statement: str) -> float:
+    '''
+    Время импорта (мс) по -X importtime: cumulative верхнеуровневых строк модуля из
+    statement и его подмодулей (ленивые подмодули пакета грузятся отдельными строками).
+    Старт интерпретатора (site и т.п.) в это время не входит.
+    '''
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    root = statement.split()[1]
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if name.startswith('  '):
+            continue  # вложенный импорт уже учтен в cumulative родителя
+        name = name.strip()
+        if name == root or name.startswith(f'{root}.'):
+            total += int(cumulative)
+    return total / 1000
+
+
+class ImportTime:
+    params = list(STATEMENTS)
+    param_names = ['what']
+
+    def track_import_ms(self, what):
+        return min(import_time(STATEMENTS[what]) for _ in range(3))
+    track_import_ms.unit = 'ms'
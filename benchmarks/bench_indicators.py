@@ -0,0 +1,61 @@
+# Per-tick cost of the shared indicator service
+
+import random
+
+from indicators import IndicatorObserver, IndicatorService
+
+
+class _Strategy(IndicatorObserver):
+    def __init__(self):
+        self.seen = 0
+
+    def indicators_updated(self, symbol, indicators) -> None:
+        self.seen += 1
+        indicators.ema, indicators.std, indicators.low, indicators.high
+
+
+class IndicatorTick:
+    '''
+    Один тик PriceListener: все symbols символов меняют цену.
+    Цена тика не должна расти с окном - обновления O(1).
+    '''
+    params = ([10, 100, 1000], [20, 1000])
+    param_names = ['symbols', 'window']
+
+    def setup(self, symbols, window):
+        rnd = random.Random(1)
+        self.service = IndicatorService(window=window)
+        self.names = [f'S{i}USDT' for i in range(symbols)]
+        self.ticks = [
+            {name: f'{rnd.uniform(1, 100):.8f}' for name in self.names}
+            for _ in range(64)
+        ]
+        for tick in self.ticks * (window // 64 + 2):
+            self.service.price_updated(tick)
+        self.position = 0
+
+    def time_tick(self, symbols, window):
+        self.position = (self.position + 1) % len(self.ticks)
+        self.service.price_updated(self.ticks[self.position])
+
+
+class SharedSubscribers:
+    '''
+    observers стратегий на одних и тех же индикаторах: расчет один на тик,
+    растет только стоимость рассылки.
+    '''
+    params = [1, 10, 100]
+    param_names = ['observers']
+
+    def setup(self, observers):
+        rnd = random.Random(1)
+        self.service = IndicatorService()
+        self.observers = [_Strategy() for _ in range(observers)]
+        for observer in self.observers:
+            self.service.register_observer(observer)
+        self.ticks = [{'BTCUSDT': f'{rnd.uniform(1, 100):.8f}'} for _ in range(64)]
+        self.position = 0
+
+    def time_tick(self, observers):
+        self.position = (self.position + 1) % len(self.ticks)
+        self.service.price_updated(self.ticks[self.position])
@@ -0,0 +1,86 @@
+# Polling throughput and signing speed of mexc_toolkit
+
+import asyncio
+import time
+
+from mexc_toolkit import mexc_market, mexc_trade
+
+from benchmarks.fake_mexc import FakeMexcServer
+
+
+class MarketPolling:
+    '''
+    Опрос /ticker/price через локальный сервер с разной задержкой.
+    '''
+    params = [0.0, 0.005]
+    param_names = ['latency']
+
+    def setup(self, latency):
+        self.server = FakeMexcServer(latency=latency, jitter=latency / 5, seed=1).start()
+        self.market = mexc_market(self.server.url)
+        self.loop = asyncio.new_event_loop()
+
+    def teardown(self, latency):
+        self.loop.close()
+        self.server.stop()
+
+    def time_get_price(self, latency):
+        self.loop.run_until_complete(self.market.get_price(params={'symbol': 'BTCUSDT'}))
+
+    def time_get_depth(self, latency):
+        self.market.get_depth(params={'symbol': 'BTCUSDT', 'limit': 100})
+
+    def track_polls_per_second(self, latency):
+        polls = 50
+        start = time.perf_counter()
+        for _ in range(polls):
+            self.loop.run_until_complete(self.market.get_price(params={'symbol': 'BTCUSDT'}))
+        return polls / (time.perf_counter() - start)
+    track_polls_per_second.unit = 'polls/s'
+
+
+class Signing:
+    '''
+    Скорость HMAC-подписи без сети.
+    '''
+    def setup(self):
+        self.trade = mexc_trade('http://127.0.0.1', 'key', 'secret' * 8)
+        self.params = {
+            'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'LIMIT',
+            'quantity': '0.001', 'price': '60000',
+        }
+
+    def time_sign_without_params(self):
+        self.trade._sign_v3(req_time=1700000000000)
+
+    def time_sign_order_params(self):
+        self.trade._sign_v3(req_time=1700000000000, sign_params=self.params)
+
+
+class OrderBurst:
+    '''
+    Пачка ордеров: каждый ордер - это /time плюс подписанный POST /order.
+    '''
+    params = [1, 20]
+    param_names = ['burst']
+
+    def setup(self, burst):
+        self.server = FakeMexcServer(latency=0.001, seed=1).start()
+        self.trade = mexc_trade(self.server.url, 'key', 'secret')
+        self.loop = asyncio.new_event_loop()
+
+    def teardown(self, burst):
+        self.loop.close()
+        self.server.stop()
+
+    async def burst(self, size):
+        return await asyncio.gather(*(
+            self.trade.post_order(params={
+                'symbol': 'BTCUSDT', 'side': 'BUY', 'type': 'LIMIT',
+                'quantity': '0.001', 'price': '60000',
+            })
+            for _ in range(size)
+        ))
+
+    def time_post_order_burst(self, burst):
+        self.loop.run_until_complete(self.burst(burst))
@@ -0,0 +1,143 @@
+# Observer fan-out and memory per symbol
+
+import asyncio
+import time
+import tracemalloc
+
+import observer
+import try_mexc
+from mexc_toolkit import mexc_market
+
+from benchmarks.fake_mexc import FakeMexcServer
+
+
+class _Widget(observer.Observer):
+    def __init__(self, weather_data, fields=None):
+        self.calls = 0
+        weather_data.register_observer(self, fields=fields)
+
+    def update(self, temperature, humidity, pressure) -> None:
+        self.calls += 1
+
+
+class _User(try_mexc.Observer):
+    def __init__(self, price_listener):
+        self.calls = 0
+        price_listener.register_observer(self)
+
+    def price_updated(self, data) -> None:
+        self.calls += 1
+
+
+async def _make_listener(**kwargs) -> try_mexc.PriceListener:
+    # AsyncIOScheduler стартует только внутри работающего цикла
+    return try_mexc.PriceListener(**kwargs)
+
+
+async def _fetch_all(listener: try_mexc.PriceListener, symbols) -> None:
+    await asyncio.gather(*(listener.fetch_price(symbol) for symbol in symbols))
+
+
+async def _shutdown(listener: try_mexc.PriceListener) -> None:
+    listener.scheduler.shutdown(wait=False)
+
+
+class WeatherFanOut:
+    '''
+    Одно измерение рассылается N гаджетам.
+    '''
+    params = [1, 100, 1000]
+    param_names = ['widgets']
+
+    def setup(self, widgets):
+        self.weather_data = observer.WeatherData()
+        self.widgets = [_Widget(self.weather_data) for _ in range(widgets)]
+
+    def time_set_measurements(self, widgets):
+        self.weather_data.set_measurements(28, 70, 30)
+
+
+class WeatherBurst:
+    '''
+    Пачка из 100k измерений на 100 гаджетов: каждое измерение отдельно,
+    блоками batch() по 1000, окном coalesce_window и с подпиской только на температуру.
+    '''
+    params = ['plain', 'batch', 'window', 'fields']
+    param_names = ['mode']
+    updates = 100_000
+    timeout = 300
+
+    def setup(self, mode):
+        self.weather_data = observer.WeatherData(coalesce_window=0.001 if mode == 'window' else 0.0)
+        fields = ('temperature',) if mode == 'fields' else None
+        self.widgets = [_Widget(self.weather_data, fields=fields) for _ in range(100)]
+
+    def track_updates_per_second(self, mode):
+        weather_data = self.weather_data
+        start = time.perf_counter()
+        if mode == 'batch':
+            for chunk in range(0, self.updates, 1000):
+                with weather_data.batch():
+                    for i in range(chunk, chunk + 1000):
+                        weather_data.set_measurements(24, 60 + i % 10, 30)
+        else:
+            for i in range(self.updates):
+                weather_data.set_measurements(24, 60 + i % 10, 30)
+        weather_data.flush()
+        return self.updates / (time.perf_counter() - start)
+    track_updates_per_second.unit = 'updates/s'
+
+
+class PriceFanOut:
+    '''
+    Одно обновление цен рассылается N пользователям PriceListener.
+    '''
+    params = [1, 100, 1000]
+    param_names = ['users']
+
+    def setup(self, users):
+        self.loop = asyncio.new_event_loop()
+        self.listener = self.loop.run_until_complete(_make_listener(hosts='http://127.0.0.1'))
+        self.users = [_User(self.listener) for _ in range(users)]
+
+    def teardown(self, users):
+        self.loop.run_until_complete(_shutdown(self.listener))
+        self.loop.close()
+
+    def time_notify_users(self, users):
+        self.listener.notify_users()
+
+
+class MemoryPerSymbol:
+    '''
+    Сколько памяти занимает один отслеживаемый символ в PriceListener.
+    '''
+    params = [10, 100]
+    param_names = ['symbols']
+
+    def setup(self, symbols):
+        self.server = FakeMexcServer(seed=1).start()
+        self.symbols = [f'T{i}USDT' for i in range(symbols)]
+        self.server.add_symbols(self.symbols)
+        # прогрев: ленивые импорты клиента не должны попасть в замер
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(mexc_market(self.server.url).get_price(params={'symbol': 'BTCUSDT'}))
+        loop.close()
+
+    def teardown(self, symbols):
+        self.server.stop()
+
+    def track_bytes_per_symbol(self, symbols):
+        loop = asyncio.new_event_loop()
+        listener = loop.run_until_complete(_make_listener(hosts=self.server.url, duration=0.05))
+        user = _User(listener)
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+        loop.run_until_complete(_fetch_all(listener, self.symbols))
+        after = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        loop.run_until_complete(_shutdown(listener))
+        loop.close()
+        growth = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+        return growth / symbols
+    track_bytes_per_symbol.unit = 'bytes'
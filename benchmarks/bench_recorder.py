@@ -0,0 +1,63 @@
+# Tick recording and replay throughput
+
+import shutil
+import tempfile
+import time
+
+from tick_recorder import TickRecorder, TickReplay
+from try_mexc import Observer
+
+
+class _Counter(Observer):
+    def __init__(self):
+        self.calls = 0
+
+    def price_updated(self, data) -> None:
+        self.calls += 1
+
+
+class Recording:
+    def setup(self):
+        self.root = tempfile.mkdtemp()
+        self.recorder = TickRecorder(self.root, fsync_interval=1.0)
+        self.ts = time.time()
+
+    def teardown(self):
+        self.recorder.close()
+        shutil.rmtree(self.root)
+
+    def time_record_tick(self):
+        self.recorder.record('BTCUSDT', 60000.0, self.ts)
+
+    def time_price_updated_100_symbols(self):
+        self.ts += 1
+        self.recorder.price_updated({f'T{i}USDT': self.ts + i for i in range(100)})
+
+
+class Replay:
+    '''
+    Проигрывание записанной сессии без задержек.
+    '''
+    params = [0, 1]
+    param_names = ['observers']
+
+    def setup(self, observers):
+        self.root = tempfile.mkdtemp()
+        recorder = TickRecorder(self.root, fsync_interval=60)
+        for i in range(200_000):
+            recorder.record(f'T{i % 10}USDT', 100.0 + i % 7, 1_700_000_000 + i * 0.001)
+        recorder.close()
+        self.replay = TickReplay(self.root)
+        self.observers = [_Counter() for _ in range(observers)]
+        for counter in self.observers:
+            self.replay.register_observer(counter)
+
+    def teardown(self, observers):
+        self.replay.close()
+        shutil.rmtree(self.root)
+
+    def track_ticks_per_second(self, observers):
+        start = time.perf_counter()
+        ticks = self.replay.run()
+        return ticks / (time.perf_counter() - start)
+    track_ticks_per_second.unit = 'ticks/s'
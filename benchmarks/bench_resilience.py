@@ -0,0 +1,91 @@
+# Hedged requests, retries and circuit breaking against an injected-fault server
+
+import asyncio
+import time
+
+from mexc_toolkit import CircuitOpenError, ResilientTransport, mexc_market
+
+from benchmarks.fake_mexc import FakeMexcServer
+
+
+class _Scenario:
+    server_options: dict = {}
+
+    def setup(self, *params):
+        self.server = FakeMexcServer(seed=1, **self.server_options).start()
+        self.market = mexc_market(self.server.url)
+        self.loop = asyncio.new_event_loop()
+
+    def teardown(self, *params):
+        self.loop.close()
+        self.server.stop()
+
+    def send(self):
+        return self.market.public_request('GET', '/api/v3/ticker/price', params={'symbol': 'BTCUSDT'})
+
+
+class HedgedTail(_Scenario):
+    '''
+    5% ответов зависают на 0.2 с: p99 задержки с дублем запроса и без.
+    '''
+    params = [False, True]
+    param_names = ['hedge']
+    server_options = {'latency': 0.002, 'stall_rate': 0.05, 'stall_time': 0.2}
+    timeout = 300
+
+    def track_p99_ms(self, hedge):
+        transport = ResilientTransport(retries=0, hedge_delay=0.01)
+
+        async def run():
+            latencies = []
+            for _ in range(300):
+                start = time.perf_counter()
+                await transport.request(self.send, '/ticker/price', hedge=hedge)
+                latencies.append(time.perf_counter() - start)
+            return sorted(latencies)[int(len(latencies) * 0.99)] * 1000
+
+        return self.loop.run_until_complete(run())
+    track_p99_ms.unit = 'ms'
+
+
+class RetryOnErrors(_Scenario):
+    '''
+    20% ответов - 503: доля успешных вызовов с повторами и без.
+    '''
+    params = [0, 2]
+    param_names = ['retries']
+    server_options = {'error_rate': 0.2}
+
+    def track_success_ratio(self, retries):
+        transport = ResilientTransport(retries=retries, backoff=0.001, hedge_delay=1, failure_threshold=1000)
+
+        async def run():
+            ok = 0
+            for _ in range(200):
+                response = await transport.request(self.send, '/ticker/price')
+                ok += response.status_code == 200
+            return ok / 200
+
+        return self.loop.run_until_complete(run())
+    track_success_ratio.unit = 'ratio'
+
+
+class CircuitBreaking(_Scenario):
+    '''
+    Эндпоинт всегда отвечает 503: сколько запросов дойдет до сервера из 200 вызовов.
+    '''
+    server_options = {'error_rate': 1.0}
+
+    def track_requests_reaching_server(self):
+        transport = ResilientTransport(retries=0, hedge_delay=1, failure_threshold=5, reset_timeout=60)
+
+        async def run():
+            for _ in range(200):
+                try:
+                    await transport.request(self.send, '/ticker/price')
+                except CircuitOpenError:
+                    pass
+
+        self.loop.run_until_complete(run())
+        return self.server.requests_served
+    track_requests_reaching_server.unit = 'requests'
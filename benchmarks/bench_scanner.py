@@ -0,0 +1,49 @@
+# Triangular scan over a full-size symbol universe
+
+import random
+
+from spread_scanner import SpreadScanner
+
+QUOTES = ('USDT', 'USDC', 'BTC', 'ETH')
+
+
+def universe(assets: int = 2500, seed: int = 1):
+    '''
+    Синтетическая вселенная размером с MEXC: все активы к USDT, часть - к USDC/BTC/ETH.
+    '''
+    rnd = random.Random(seed)
+    symbols, book = [], []
+    prices = {'USDT': 1.0, 'USDC': 1.0, 'BTC': 60000.0, 'ETH': 3000.0}
+    for i in range(assets):
+        prices[f'A{i}'] = rnd.uniform(0.001, 100)
+    for asset, price in prices.items():
+        quotes = ['USDT'] + [quote for quote in QUOTES[1:] if rnd.random() < 0.15]
+        for quote in quotes:
+            if quote == asset or (asset in QUOTES and QUOTES.index(asset) < QUOTES.index(quote)):
+                continue
+            mid = price / prices[quote]
+            symbol = asset + quote
+            symbols.append({'symbol': symbol, 'baseAsset': asset, 'quoteAsset': quote, 'status': '1'})
+            book.append({'symbol': symbol, 'bidPrice': str(mid * 0.999), 'askPrice': str(mid * 1.001)})
+    return {'symbols': symbols}, book
+
+
+class TriangularScan:
+    def setup(self):
+        info, self.book = universe()
+        self.scanner = SpreadScanner(info, threshold=0.0)
+        self.scanner.update(self.book)
+
+    def time_update_book(self):
+        self.scanner.update(self.book)
+
+    def time_evaluate_paths(self):
+        self.scanner.evaluate()
+
+    def time_tick(self):
+        self.scanner.update(self.book)
+        self.scanner.scan()
+
+    def track_paths(self):
+        return len(self.scanner.paths)
+    track_paths.unit = 'paths'
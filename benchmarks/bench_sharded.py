@@ -0,0 +1,71 @@
+# Sharded ingestion throughput and snapshot reads
+
+import multiprocessing as mp
+import time
+
+from sharded_listener import SharedPriceSnapshot, ShardedPriceListener
+
+from benchmarks.fake_mexc import FakeMexcServer
+
+
+def _serve(symbols, urls, stop_event) -> None:
+    with FakeMexcServer(latency=0.002, seed=1) as server:
+        server.add_symbols(symbols)
+        urls.put(server.url)
+        stop_event.wait()
+
+
+class ShardedIngestion:
+    '''
+    Сколько цен в секунду пишут шарды в общий снимок.
+    Сервер живет в отдельном процессе, чтобы не делить GIL с бенчмарком.
+    '''
+    params = [1, 2, 4]
+    param_names = ['shards']
+    timeout = 120
+
+    def setup(self, shards):
+        self.symbols = [f'T{i}USDT' for i in range(32)]
+        urls = mp.Queue()
+        self.stop_server = mp.Event()
+        self.server = mp.Process(target=_serve, args=(self.symbols, urls, self.stop_server), daemon=True)
+        self.server.start()
+        self.url = urls.get(timeout=10)
+
+    def teardown(self, shards):
+        self.stop_server.set()
+        self.server.join()
+
+    def track_ticks_per_second(self, shards):
+        listener = ShardedPriceListener(self.symbols, shards=shards, hosts=self.url, interval=0)
+        listener.start()
+        try:
+            time.sleep(1)
+            start_ticks = sum(listener.snapshot.seq) // 2
+            start = time.perf_counter()
+            time.sleep(2)
+            ticks = sum(listener.snapshot.seq) // 2 - start_ticks
+            return ticks / (time.perf_counter() - start)
+        finally:
+            listener.stop()
+    track_ticks_per_second.unit = 'ticks/s'
+
+
+class SnapshotRead:
+    '''
+    Чтение цены из shared memory против обычного dict.
+    '''
+    def setup(self):
+        self.symbols = [f'T{i}USDT' for i in range(2000)]
+        self.snapshot = SharedPriceSnapshot(self.symbols)
+        for slot in range(len(self.symbols)):
+            self.snapshot.write(slot, 100.0 + slot)
+
+    def teardown(self):
+        self.snapshot.close()
+
+    def time_read_symbol(self):
+        self.snapshot['T1000USDT']
+
+    def time_versions(self):
+        self.snapshot.versions()
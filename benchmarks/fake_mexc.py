@@ -0,0 +1,186 @@
+# Local MEXC stand-in for benchmarks
+
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+'''
+Локальная подмена https://api.mexc.com для бенчмарков.
+Отдает /api/v3/ticker/price, /api/v3/depth, /api/v3/time и /api/v3/order
+с настраиваемой задержкой (latency) и разбросом (jitter) в секундах.
+Сбои: error_rate - доля ответов 503, stall_rate - доля ответов, зависающих на stall_time.
+Цены каждого символа гуляют случайным образом, ордера хранятся в памяти.
+
+Пример:
+    with FakeMexcServer(latency=0.005, jitter=0.002) as server:
+        market = mexc_market(server.url)
+'''
+
+DEFAULT_SYMBOLS = ('BTCUSDT', 'ETHUSDT', 'MXUSDT')
+
+
+class FakeMexcServer:
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0,
+                 host: str = '127.0.0.1', port: int = 0, seed: Optional[int] = None,
+                 error_rate: float = 0.0, stall_rate: float = 0.0, stall_time: float = 1.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.stall_rate = stall_rate
+        self.stall_time = stall_time
+        self.requests_served = 0
+        self.__random = random.Random(seed)
+        self.__lock = threading.Lock()
+        self.__prices: Dict[str, float] = {symbol: 100.0 for symbol in DEFAULT_SYMBOLS}
+        self.__orders: Dict[int, dict] = {}
+        self.__client_ids: Dict[str, int] = {}
+        self.__order_id = 0
+        self.__httpd = ThreadingHTTPServer((host, port), self.__make_handler())
+        self.__httpd.daemon_threads = True
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.__httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> 'FakeMexcServer':
+        self.__thread = threading.Thread(target=self.__httpd.serve_forever, daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.__httpd.shutdown()
+        self.__httpd.server_close()
+        if self.__thread is not None:
+            self.__thread.join()
+
+    def __enter__(self) -> 'FakeMexcServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def add_symbols(self, symbols) -> None:
+        with self.__lock:
+            for symbol in symbols:
+                self.__prices.setdefault(symbol, 100.0)
+
+    def delay(self) -> None:
+        pause = self.latency
+        if self.jitter:
+            pause += self.__random.uniform(-self.jitter, self.jitter)
+        if self.stall_rate and self.__random.random() < self.stall_rate:
+            pause += self.stall_time
+        if pause > 0:
+            time.sleep(pause)
+
+    def fails(self) -> bool:
+        return bool(self.error_rate) and self.__random.random() < self.error_rate
+
+    def price(self, symbol: str) -> float:
+        with self.__lock:
+            price = self.__prices.setdefault(symbol, 100.0)
+            price *= 1 + self.__random.uniform(-0.001, 0.001)
+            self.__prices[symbol] = price
+        return price
+
+    def ticker_price(self, params: dict):
+        if 'symbol' in params:
+            return {'symbol': params['symbol'], 'price': f'{self.price(params["symbol"]):.8f}'}
+        return [{'symbol': symbol, 'price': f'{self.price(symbol):.8f}'} for symbol in list(self.__prices)]
+
+    def depth(self, params: dict):
+        price = self.price(params.get('symbol', 'BTCUSDT'))
+        limit = int(params.get('limit', 100))
+        step = price * 0.0001
+        return {
+            'lastUpdateId': int(time.time() * 1000),
+            'bids': [[f'{price - step * (i + 1):.8f}', '1.0'] for i in range(limit)],
+            'asks': [[f'{price + step * (i + 1):.8f}', '1.0'] for i in range(limit)],
+        }
+
+    def server_time(self, params: dict):
+        return {'serverTime': int(time.time() * 1000)}
+
+    def order(self, method: str, params: dict):
+        if 'signature' not in params or 'timestamp' not in params:
+            return 400, {'code': 700002, 'msg': 'Signature for this request is not valid.'}
+        with self.__lock:
+            client_id = params.get('newClientOrderId') or params.get('origClientOrderId')
+            by_client = self.__orders.get(self.__client_ids.get(client_id, 0)) if client_id else None
+            if method == 'POST':
+                if by_client is not None:
+                    return 400, {'code': 30032, 'msg': 'Duplicate clientOrderId'}
+                self.__order_id += 1
+                order = {
+                    'symbol': params.get('symbol'),
+                    'orderId': str(self.__order_id),
+                    'clientOrderId': params.get('newClientOrderId', ''),
+                    'price': params.get('price', '0'),
+                    'origQty': params.get('quantity', '0'),
+                    'type': params.get('type', 'LIMIT'),
+                    'side': params.get('side', 'BUY'),
+                    'status': 'NEW',
+                    'transactTime': int(time.time() * 1000),
+                }
+                self.__orders[self.__order_id] = order
+                if client_id:
+                    self.__client_ids[client_id] = self.__order_id
+                return 200, order
+            order = by_client if 'origClientOrderId' in params else self.__orders.get(int(params.get('orderId', 0)))
+            if order is None:
+                return 400, {'code': -2013, 'msg': 'Order does not exist.'}
+            if method == 'DELETE':
+                order['status'] = 'CANCELED'
+            return 200, order
+
+    def __make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args) -> None:
+                pass
+
+            def handle_any(self) -> None:
+                parts = urlsplit(self.path)
+                params = dict(parse_qsl(parts.query))
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    params.update(parse_qsl(self.rfile.read(length).decode()))
+                server.delay()
+                status, payload = 200, None
+                path = parts.path
+                if server.fails():
+                    status, payload = 503, {'code': 503, 'msg': 'Service Unavailable'}
+                elif path == '/api/v3/ticker/price':
+                    payload = server.ticker_price(params)
+                elif path == '/api/v3/depth':
+                    payload = server.depth(params)
+                elif path == '/api/v3/time':
+                    payload = server.server_time(params)
+                elif path == '/api/v3/order':
+                    status, payload = server.order(self.command, params)
+                else:
+                    status, payload = 404, {'code': 404, 'msg': f'Unknown path {path}'}
+                server.requests_served += 1
+                body = json.dumps(payload).encode()
+                try:
+                    self.send_response(status)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # клиент не дождался ответа (таймаут запроса) - это не ошибка сервера
+                    self.close_connection = True
+
+            do_GET = do_POST = do_DELETE = do_PUT = handle_any
+
+        return Handler
@@ -0,0 +1,160 @@
+# Concurrent small-asset (dust) sweep across many accounts
+
+import asyncio
+import json
+import os
+import random
+import uuid
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from loguru import logger
+
+from mexc_toolkit import mexc_capital
+
+'''
+Уборка "пыли" по многим (суб)аккаунтам. У каждого аккаунта свой mexc_capital
+со своими ключами.
+
+1. fetch_convertible - списки конвертируемых активов всех аккаунтов параллельно
+   (не больше concurrency запросов одновременно).
+2. sweep - конвертация пачками не больше MAX_CONVERT_ASSETS активов за вызов,
+   с повторами и экспоненциальной паузой со случайным разбросом.
+3. Журнал (journal_path, JSON) хранит id sweep'а (run) и уже сконвертированные в нем
+   активы по аккаунтам и пишется после каждой пачки. sweep(run=pipeline.run) доделывает
+   прерванный sweep и не трогает то, что уже сделано; новый sweep (run=None или другой
+   id) начинает журнал заново - новая пыль тех же активов конвертируется снова, даже
+   если какой-то актив прошлого sweep'а так и не сконвертировался.
+
+Результат - {account: {asset: CONVERTED | DONE_BEFORE | 'FAILED: ...'}}.
+'''
+
+MAX_CONVERT_ASSETS = 15  # лимит MEXC на один вызов /capital/convert
+CONVERTED = 'CONVERTED'
+DONE_BEFORE = 'DONE_BEFORE'
+
+
+class CapitalPipeline:
+    def __init__(self, accounts: Dict[str, mexc_capital], journal_path: Optional[str] = None,
+                 concurrency: int = 8, retries: int = 3, backoff: float = 0.5):
+        self.__accounts = accounts
+        self.__journal_path = journal_path
+        self.__semaphore = asyncio.Semaphore(concurrency)
+        self.__retries = retries
+        self.__backoff = backoff
+        self.__run, self.__done = self.__load_journal()
+
+    # --- Журнал ---
+
+    def __load_journal(self) -> Tuple[Optional[str], Dict[str, Set[str]]]:
+        if not self.__journal_path or not os.path.exists(self.__journal_path):
+            return None, {}
+        with open(self.__journal_path) as f:
+            journal = json.load(f)
+        return journal.get('run'), {account: set(assets) for account, assets in journal.get('done', {}).items()}
+
+    def __save_journal(self) -> None:
+        if not self.__journal_path:
+            return
+        tmp = f'{self.__journal_path}.tmp'
+        with open(tmp, 'w') as f:
+            json.dump({
+                'run': self.__run,
+                'done': {account: sorted(assets) for account, assets in self.__done.items()},
+            }, f)
+        os.replace(tmp, self.__journal_path)
+
+    @property
+    def run(self) -> Optional[str]:
+        # id последнего sweep'а из журнала
+        return self.__run
+
+    def done(self, account: str) -> Set[str]:
+        return set(self.__done.get(account, ()))
+
+    # --- Запросы ---
+
+    async def __call(self, what: str, request):
+        '''
+        request - функция без аргументов, возвращающая корутину запроса.
+        Повторяет при исключении или ответе с ошибкой ({'code': ..., 'msg': ...}).
+        '''
+        for attempt in range(self.__retries + 1):
+            try:
+                async with self.__semaphore:
+                    res = await request()
+                if not (isinstance(res, dict) and res.get('code') not in (None, 0, 200)):
+                    return res
+                error = f"{res.get('code')} {res.get('msg')}"
+            except Exception as e:
+                error = repr(e)
+            if attempt < self.__retries:
+                delay = self.__backoff * 2 ** attempt * random.uniform(0.5, 1.5)
+                logger.warning(f'{what} failed ({error}), retry in {delay:.2f}s')
+                await asyncio.sleep(delay)
+        raise RuntimeError(f'{what} failed: {error}')
+
+    @staticmethod
+    def __assets(res) -> List[str]:
+        details = res.get('details', res.get('data', [])) if isinstance(res, dict) else res
+        return [item['asset'] if isinstance(item, dict) else item for item in details]
+
+    async def fetch_convertible(self, accounts: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        names = list(accounts) if accounts is not None else list(self.__accounts)
+
+        async def fetch(name: str):
+            res = await self.__call(f'{name}: convert list', self.__accounts[name].get_smallAssets_list)
+            return self.__assets(res)
+
+        results = await asyncio.gather(*(fetch(name) for name in names), return_exceptions=True)
+        convertible = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error(f'{name}: {result}')
+                continue
+            convertible[name] = result
+        return convertible
+
+    async def __sweep_account(self, name: str, assets: List[str]) -> Dict[str, str]:
+        done = self.__done.setdefault(name, set())
+        report = {asset: DONE_BEFORE for asset in assets if asset in done}
+        todo = [asset for asset in assets if asset not in done]
+        capital = self.__accounts[name]
+        for start in range(0, len(todo), MAX_CONVERT_ASSETS):
+            batch = todo[start:start + MAX_CONVERT_ASSETS]
+            try:
+                res = await self.__call(
+                    f'{name}: convert {",".join(batch)}',
+                    lambda batch=batch: capital.post_smallAssets_convert(params={'asset': ','.join(batch)}),
+                )
+            except RuntimeError as e:
+                report.update({asset: f'FAILED: {e}' for asset in batch})
+                continue
+            failed_list = (res.get('failedList') or []) if isinstance(res, dict) else []
+            failed = {item['asset'] if isinstance(item, dict) else item: item for item in failed_list}
+            for asset in batch:
+                if asset in failed:
+                    report[asset] = f'FAILED: {failed[asset]}'
+                else:
+                    report[asset] = CONVERTED
+                    done.add(asset)
+            self.__save_journal()
+        return report
+
+    async def sweep(self, convertible: Optional[Dict[str, List[str]]] = None,
+                    run: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+        '''
+        run - id sweep'а. Тот же id, что в журнале (pipeline.run), доделывает прерванный
+        sweep; любой другой или None начинает новый с пустым журналом.
+        '''
+        if run is None or run != self.__run:
+            self.__run = run or uuid.uuid4().hex
+            self.__done = {}
+            self.__save_journal()
+        if convertible is None:
+            convertible = await self.fetch_convertible()
+        names = list(convertible)
+        reports = await asyncio.gather(*(self.__sweep_account(name, convertible[name]) for name in names))
+        for name, report in zip(names, reports):
+            converted = sum(1 for status in report.values() if status == CONVERTED)
+            logger.info(f'{name}: converted {converted} of {len(report)} assets')
+        return dict(zip(names, reports))
@@ -1,5 +1,11 @@
-STABLE = 'USDT'
-TIMING = {
-    'price_check': 60,
+from typing import Dict
+
+STABLE: str = 'USDT'
+TIMEZONE: str = 'Europe/Moscow'
+TIMING: Dict[str, float] = {
+    'price_check': 60,    # сколько секунд опрашивать цену после листинга
+    'price_cadence': 0.5,  # пауза между запросами цены
+    'order_retry': 5,     # сколько секунд повторять ордер, пока символ не откроется
 }
-RESPONSE_MAX_TIME = 0.5
\ No newline at end of file
+RESPONSE_MAX_TIME: float = 0.5
+LISTINGS_FILE: str = 'listings.csv'
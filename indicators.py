@@ -0,0 +1,215 @@
+# Shared incremental indicators over the live price feed
+
+import asyncio
+import math
+import time
+from abc import ABC, abstractmethod
+from collections import Counter, deque
+from typing import Dict, Iterable, Optional, Tuple
+
+from loguru import logger
+
+from mexc_toolkit import mexc_market
+from subject import Subject
+from try_mexc import Observer
+
+'''
+IndicatorService - наблюдатель PriceListener (или любого субъекта с price_updated)
+и сам субъект. На каждый тик символа (изменение его цены) за O(1) обновляет:
+
+- ema        - экспоненциальное среднее, alpha = 2 / (ema_span + 1);
+- mean / std - скользящие среднее и стандартное отклонение за window тиков
+               (скользящий вариант алгоритма Уэлфорда, без сумм квадратов);
+- low / high - минимум и максимум за window тиков (монотонные очереди, O(1) амортизированно);
+- vwap       - VWAP сделок за vwap_window секунд, сделки берутся из
+               get_aggtrades / get_deals через poll_trades.
+
+Считается один раз на тик, сколько бы ни было подписчиков. Подписчик получает
+indicators_updated(symbol, indicators) и может подписаться только на свои символы:
+service.register_observer(strategy, fields=['BTCUSDT']).
+'''
+
+
+class IndicatorObserver(ABC):
+    @abstractmethod
+    def indicators_updated(self, symbol: str, indicators: 'SymbolIndicators') -> None:
+        pass
+
+
+class SymbolIndicators:
+    __slots__ = (
+        'ema', 'mean', 'ticks', 'last', '_alpha', '_window', '_values', '_m2',
+        '_lows', '_highs', '_trades', '_vwap_window', '_pq', '_q', '_trade_ts', '_trade_counts',
+    )
+
+    def __init__(self, ema_span: int, window: int, vwap_window: float):
+        self._alpha = 2 / (ema_span + 1)
+        self._window = window
+        self._values = deque()
+        self._m2 = 0.0
+        self._lows = deque()   # (номер тика, цена), цены возрастают
+        self._highs = deque()  # (номер тика, цена), цены убывают
+        self._trades = deque()  # (время, цена * объем, объем)
+        self._vwap_window = vwap_window
+        self._pq = 0.0
+        self._q = 0.0
+        self._trade_ts = -1
+        self._trade_counts = Counter()  # (цена, объем) -> сколько таких сделок учтено в _trade_ts
+        self.ema = math.nan
+        self.mean = math.nan
+        self.ticks = 0
+        self.last = math.nan
+
+    def add(self, price: float) -> None:
+        self.last = price
+        self.ema = price if self.ticks == 0 else self.ema + self._alpha * (price - self.ema)
+
+        values = self._values
+        values.append(price)
+        n = len(values)
+        if n == 1:
+            self.mean = price
+            self._m2 = 0.0
+        elif n <= self._window:
+            delta = price - self.mean
+            self.mean += delta / n
+            self._m2 += delta * (price - self.mean)
+        else:
+            # окно полно: новое значение заменяет самое старое
+            old = values.popleft()
+            mean = self.mean + (price - old) / self._window
+            self._m2 += (price - old) * (price - mean + old - self.mean)
+            self.mean = mean
+
+        tick, oldest = self.ticks, self.ticks - self._window
+        lows, highs = self._lows, self._highs
+        while lows and lows[-1][1] >= price:
+            lows.pop()
+        lows.append((tick, price))
+        while lows[0][0] <= oldest:
+            lows.popleft()
+        while highs and highs[-1][1] <= price:
+            highs.pop()
+        highs.append((tick, price))
+        while highs[0][0] <= oldest:
+            highs.popleft()
+        self.ticks += 1
+
+    @property
+    def std(self) -> float:
+        n = len(self._values)
+        return math.sqrt(max(self._m2, 0.0) / (n - 1)) if n > 1 else math.nan
+
+    @property
+    def low(self) -> float:
+        return self._lows[0][1] if self._lows else math.nan
+
+    @property
+    def high(self) -> float:
+        return self._highs[0][1] if self._highs else math.nan
+
+    def add_trades(self, trades: Iterable[Tuple[int, float, float]]) -> int:
+        '''
+        trades - (время в мс, цена, объем) из одного ответа биржи. Ответы опросов
+        перекрываются, а id сделок MEXC не отдает, поэтому сделки старше последней
+        учтенной миллисекунды отбрасываются, а в ней самой новыми считаются только
+        одинаковые (цена, объем) сверх уже учтенного числа.
+        '''
+        trades = sorted(trades)
+        if not trades:
+            return 0
+        boundary, counted = self._trade_ts, self._trade_counts
+        seen = Counter()
+        added = 0
+        for ts, price, qty in trades:
+            if ts < boundary:
+                continue
+            if ts == boundary:
+                seen[price, qty] += 1
+                if seen[price, qty] <= counted[price, qty]:
+                    continue
+            self._trades.append((ts, price * qty, qty))
+            self._pq += price * qty
+            self._q += qty
+            added += 1
+        newest = trades[-1][0]
+        if newest > boundary:
+            self._trade_ts = newest
+            self._trade_counts = Counter((price, qty) for ts, price, qty in trades if ts == newest)
+        else:
+            self._trade_counts = counted | seen
+        return added
+
+    def expire_trades(self, now_ms: float) -> None:
+        trades, oldest = self._trades, now_ms - self._vwap_window * 1000
+        while trades and trades[0][0] < oldest:
+            _, pq, q = trades.popleft()
+            self._pq -= pq
+            self._q -= q
+        if not trades:
+            self._pq = self._q = 0.0  # сбрасываем накопленную ошибку округления
+
+    @property
+    def vwap(self) -> float:
+        return self._pq / self._q if self._q > 0 else math.nan
+
+    def __repr__(self) -> str:
+        return (f'SymbolIndicators(last={self.last}, ema={self.ema:.8g}, mean={self.mean:.8g}, '
+                f'std={self.std:.8g}, low={self.low}, high={self.high}, vwap={self.vwap:.8g})')
+
+
+class IndicatorService(Subject, Observer):
+    notify_method = 'indicators_updated'
+
+    def __init__(self, subject: Optional[Subject] = None, ema_span: int = 20, window: int = 50,
+                 vwap_window: float = 300.0):
+        super().__init__()
+        self.__ema_span = ema_span
+        self.__window = window
+        self.__vwap_window = vwap_window
+        self.__symbols: Dict[str, SymbolIndicators] = {}
+        if subject is not None:
+            subject.register_observer(self)
+
+    def get(self, symbol: str) -> SymbolIndicators:
+        indicators = self.__symbols.get(symbol)
+        if indicators is None:
+            indicators = self.__symbols[symbol] = SymbolIndicators(
+                self.__ema_span, self.__window, self.__vwap_window,
+            )
+        return indicators
+
+    def price_updated(self, data) -> None:
+        for symbol, price in data.items():
+            price = float(price)
+            indicators = self.get(symbol)
+            if indicators.ticks and indicators.last == price:
+                continue
+            indicators.add(price)
+            self.notify_changed((symbol,), symbol, indicators)
+
+    def add_trades(self, symbol: str, trades: Iterable[dict]) -> int:
+        '''
+        trades - ответ get_aggtrades ({'p', 'q', 'T'}) или get_deals ({'price', 'qty', 'time'}).
+        '''
+        indicators = self.get(symbol)
+        added = indicators.add_trades(
+            (int(trade['T']), float(trade['p']), float(trade['q'])) if 'T' in trade
+            else (int(trade['time']), float(trade['price']), float(trade['qty']))
+            for trade in trades
+        )
+        indicators.expire_trades(time.time() * 1000)
+        return added
+
+    async def poll_trades(self, market: mexc_market, symbol: str, duration: float,
+                          interval: float = 1.0, aggregated: bool = True) -> None:
+        timelimit = time.monotonic() + duration
+        fetch = market.get_aggtrades if aggregated else market.get_deals
+        while time.monotonic() <= timelimit:
+            try:
+                trades = await asyncio.to_thread(fetch, {'symbol': symbol, 'limit': 500})
+                if self.add_trades(symbol, trades):
+                    self.notify_changed((symbol,), symbol, self.get(symbol))
+            except Exception as e:
+                logger.error(f'Trades poll failed for {symbol}: {e!r}')
+            await asyncio.sleep(interval)
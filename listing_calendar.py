@@ -0,0 +1,142 @@
+# Listing calendar: typed listing specs loaded from CSV/JSON
+
+import csv
+import datetime as dt
+import json
+import math
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+from zoneinfo import ZoneInfo
+
+from config import TIMING, TIMEZONE, STABLE, RESPONSE_MAX_TIME
+
+'''
+Календарь листингов - файл CSV или JSON, по строке (объекту) на листинг:
+
+    token,listing,duration,cadence,timeout,order_amount,order_price
+    BTC,2024-07-15 12:02:00,,,,,
+    NEWT,2024-07-16 15:00:00,300,0.2,0.3,50,
+
+Обязательны token и listing (ISO; время без смещения считается в TIMEZONE из config).
+Остальные колонки - переопределения для этого листинга, пустое значение - умолчание из config:
+- stable       - котируемая валюта (STABLE);
+- duration     - сколько секунд опрашивать цену (TIMING['price_check']);
+- cadence      - пауза между запросами (TIMING['price_cadence']);
+- timeout      - ожидание ответа (RESPONSE_MAX_TIME);
+- order_amount - если задано, в момент листинга ставится BUY на эту сумму в stable:
+                 MARKET на quoteOrderQty или LIMIT по order_price.
+
+JSON - список таких объектов или {"listings": [...]}.
+Файл проверяется целиком один раз при загрузке: все ошибки собираются в CalendarError.
+'''
+
+_TZ = ZoneInfo(TIMEZONE)
+FIELDS = ('token', 'listing', 'stable', 'duration', 'cadence', 'timeout', 'order_amount', 'order_price')
+
+
+class CalendarError(ValueError):
+    def __init__(self, path: str, errors: List[str]):
+        super().__init__(f'{path}: {len(errors)} invalid listing(s):\n' + '\n'.join(errors))
+        self.errors = errors
+
+
+@dataclass(frozen=True)
+class ListingSpec:
+    token: str
+    listing: dt.datetime
+    stable: str = STABLE
+    duration: float = TIMING['price_check']
+    cadence: float = TIMING['price_cadence']
+    timeout: float = RESPONSE_MAX_TIME
+    order_amount: Optional[float] = None
+    order_price: Optional[float] = None
+
+    @property
+    def symbol(self) -> str:
+        return self.token + self.stable
+
+    @property
+    def key(self) -> str:
+        # один и тот же листинг в новой версии файла получает тот же ключ (и id задач)
+        return f'{self.symbol}@{self.listing.isoformat()}'
+
+    @property
+    def ends(self) -> dt.datetime:
+        return self.listing + dt.timedelta(seconds=self.duration)
+
+    @classmethod
+    def parse(cls, row: dict) -> 'ListingSpec':
+        if not isinstance(row, dict):
+            raise ValueError(f'expected an object, got {type(row).__name__}')
+        unknown = {str(name) for name in row if name not in FIELDS}
+        if unknown:
+            raise ValueError(f'unknown field(s) {", ".join(sorted(unknown))}')
+        token = str(row.get('token') or '').strip().upper()
+        if not token.isalnum():
+            raise ValueError(f'bad token {row.get("token")!r}')
+        listing = row.get('listing')
+        if not listing:
+            raise ValueError('listing time is missing')
+        listing = dt.datetime.fromisoformat(str(listing).strip())
+        if listing.tzinfo is None:
+            listing = listing.replace(tzinfo=_TZ)
+        values = {}
+        for name in ('duration', 'cadence', 'timeout', 'order_amount', 'order_price'):
+            value = row.get(name)
+            if value is None or value == '':
+                continue
+            value = float(value)
+            if not (math.isfinite(value) and value > 0):
+                raise ValueError(f'{name} must be positive, got {row[name]!r}')
+            values[name] = value
+        if 'order_price' in values and 'order_amount' not in values:
+            raise ValueError('order_price without order_amount')
+        if row.get('stable'):
+            values['stable'] = str(row['stable']).strip().upper()
+        spec = cls(token, listing, **values)
+        try:
+            spec.ends
+        except OverflowError:
+            raise ValueError(f'duration {spec.duration} is out of range') from None
+        return spec
+
+
+def _read_rows(path: str) -> Iterable[dict]:
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, newline='') as f:
+        if ext == '.csv':
+            return list(csv.DictReader(f))
+        if ext == '.json':
+            data = json.load(f)
+            if isinstance(data, dict):
+                data = data.get('listings')
+            if not isinstance(data, list):
+                raise ValueError('expected a list of listings or {"listings": [...]}')
+            return data
+    raise ValueError(f'unsupported calendar format {ext!r}, expected .csv or .json')
+
+
+def load_calendar(path: str) -> Dict[str, ListingSpec]:
+    '''
+    Возвращает {spec.key: spec} в порядке файла или бросает CalendarError со всеми ошибками.
+    '''
+    try:
+        rows = _read_rows(path)
+    except (ValueError, csv.Error) as e:
+        raise CalendarError(path, [f'  {e}']) from e
+    specs: Dict[str, ListingSpec] = {}
+    errors: List[str] = []
+    for line, row in enumerate(rows, start=1):
+        try:
+            spec = ListingSpec.parse(row)
+        except Exception as e:
+            errors.append(f'  #{line}: {e}')
+            continue
+        if spec.key in specs:
+            errors.append(f'  #{line}: duplicate listing {spec.key}')
+            continue
+        specs[spec.key] = spec
+    if errors:
+        raise CalendarError(path, errors)
+    return specs
@@ -0,0 +1,234 @@
+# Config-driven runtime: schedules pollers and order arms from the listing calendar
+
+import asyncio
+import datetime as dt
+import hashlib
+import os
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from config import LISTINGS_FILE, TIMING
+from listing_calendar import CalendarError, ListingSpec, load_calendar
+from mexc_toolkit import CircuitOpenError, mexc_trade
+from mexc_toolkit.resilience import RETRYABLE_STATUS
+from try_mexc import PriceListener, User
+
+'''
+ListingRuntime берет календарь (listing_calendar) и ставит задачи на планировщик PriceListener:
+- poll:<key> - PriceListener.add_token: fetch_price с переопределениями листинга;
+- arm:<key>  - ордер в момент листинга (если задан order_amount и передан trade).
+
+Задачи добавляются пачкой при приостановленном планировщике - он просыпается один раз,
+а не на каждую задачу. reload() сравнивает новую версию файла с загруженной:
+новые листинги добавляются, исчезнувшие снимаются, у изменившихся задача опроса
+заменяется на ту же дату, а у ордера обновляются аргументы (modify_job);
+остальные задачи не трогаются.
+Битый файл не применяется - остается предыдущий календарь.
+watch() перечитывает файл при изменении mtime.
+'''
+
+
+class ListingRuntime:
+    def __init__(self, listener: PriceListener, path: str = LISTINGS_FILE,
+                 trade: Optional[mexc_trade] = None):
+        self.listener = listener
+        self.path = path
+        self.__trade = trade
+        self.__specs: Dict[str, ListingSpec] = {}
+        self.__mtime: Optional[float] = None
+
+    @property
+    def specs(self) -> Dict[str, ListingSpec]:
+        return dict(self.__specs)
+
+    # --- Загрузка ---
+
+    def load(self) -> Tuple[int, int, int]:
+        '''
+        Читает календарь и приводит задачи в соответствие с ним.
+        Возвращает (добавлено, изменено, снято) листингов.
+        '''
+        self.__mtime = os.stat(self.path).st_mtime
+        # прошедшие листинги не планируем
+        specs = {
+            key: spec for key, spec in load_calendar(self.path).items()
+            if spec.ends > dt.datetime.now(spec.listing.tzinfo)
+        }
+        old = self.__specs
+        added = [spec for key, spec in specs.items() if key not in old]
+        changed = [spec for key, spec in specs.items() if key in old and old[key] != spec]
+        removed = [spec for key, spec in old.items() if key not in specs]
+
+        from apscheduler.schedulers.base import STATE_RUNNING
+        scheduler = self.listener.scheduler
+        # на время пачки планировщик на паузе: add_job не будит его на каждую задачу
+        bulk = scheduler.state == STATE_RUNNING
+        if bulk:
+            scheduler.pause()
+        try:
+            for spec in removed:
+                self.__unschedule(spec)
+            for spec in changed:
+                self.__reschedule(spec)
+            for spec in added:
+                self.__schedule_poll(spec)
+                self.__schedule_arm(spec)
+        finally:
+            if bulk:
+                scheduler.resume()
+        self.__specs = specs
+        logger.info(f'Listing calendar {self.path}: {len(specs)} listings, '
+                    f'+{len(added)} ~{len(changed)} -{len(removed)}')
+        return len(added), len(changed), len(removed)
+
+    def reload(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            return self.load()
+        except (OSError, CalendarError) as e:
+            logger.error(f'Listing calendar reload failed, keeping previous: {e}')
+        except Exception as e:
+            # watch() не должен умирать ни от какого файла
+            logger.error(f'Listing calendar reload failed, keeping previous: {e!r}')
+        return None
+
+    async def watch(self, interval: float = 5.0) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                mtime = os.stat(self.path).st_mtime
+            except OSError as e:
+                logger.warning(f'Listing calendar unavailable: {e!r}')
+                continue
+            if mtime != self.__mtime:
+                self.reload()
+
+    # --- Задачи ---
+
+    def __schedule_poll(self, spec: ListingSpec) -> None:
+        # листинг уже идет (перезапуск посреди опроса) - опрашиваем оставшееся время
+        now = dt.datetime.now(spec.listing.tzinfo)
+        self.listener.add_token(
+            spec.token,
+            max(spec.listing, now),
+            job_id=f'poll:{spec.key}',
+            stable=spec.stable,
+            duration=min(spec.duration, (spec.ends - now).total_seconds()),
+            cadence=spec.cadence,
+            timeout=spec.timeout,
+        )
+
+    def __schedule_arm(self, spec: ListingSpec) -> None:
+        if spec.order_amount is None or spec.listing < dt.datetime.now(spec.listing.tzinfo):
+            return
+        if self.__trade is None:
+            logger.warning(f'{spec.key}: order_amount set but runtime has no trade client, order not armed')
+            return
+        self.listener.scheduler.add_job(
+            self.place_order,
+            'date',
+            id=f'arm:{spec.key}',
+            run_date=spec.listing,
+            misfire_grace_time=1,
+            replace_existing=True,
+            kwargs={'spec': spec},
+        )
+
+    def __unschedule(self, spec: ListingSpec) -> None:
+        for job_id in (f'poll:{spec.key}', f'arm:{spec.key}'):
+            job = self.listener.scheduler.get_job(job_id)
+            if job is not None:
+                job.remove()
+
+    def __reschedule(self, spec: ListingSpec) -> None:
+        # время листинга входит в ключ, поэтому задача опроса заменяется на ту же дату;
+        # уже запущенный опрос дорабатывает со старыми параметрами
+        scheduler = self.listener.scheduler
+        if scheduler.get_job(f'poll:{spec.key}') is not None:
+            self.__schedule_poll(spec)
+        arm = scheduler.get_job(f'arm:{spec.key}')
+        if arm is None:
+            self.__schedule_arm(spec)
+        elif spec.order_amount is None:
+            arm.remove()
+        else:
+            arm.modify(kwargs={'spec': spec})
+
+    # --- Ордер ---
+
+    @staticmethod
+    def client_order_id(spec: ListingSpec) -> str:
+        # один и тот же при повторах и перезапусках - по нему ищем ордер после сбоя
+        return 'lst' + hashlib.sha1(spec.key.encode()).hexdigest()[:29]
+
+    @classmethod
+    def order_params(cls, spec: ListingSpec) -> dict:
+        params = {'symbol': spec.symbol, 'side': 'BUY', 'newClientOrderId': cls.client_order_id(spec)}
+        if spec.order_price is None:
+            params.update(type='MARKET', quoteOrderQty=f'{spec.order_amount:f}')
+        else:
+            params.update(type='LIMIT', price=f'{spec.order_price:f}',
+                          quantity=f'{spec.order_amount / spec.order_price:f}')
+        return params
+
+    async def find_order(self, spec: ListingSpec) -> Optional[dict]:
+        # поиск идет следом за запросом, который мог еще не дойти до биржи, - ждем дольше
+        try:
+            res = await asyncio.wait_for(
+                self.__trade.get_order({'symbol': spec.symbol, 'origClientOrderId': self.client_order_id(spec)}),
+                timeout=2 * spec.timeout,
+            )
+        except Exception as e:
+            logger.warning(f'{spec.key}: order lookup failed: {e!r}')
+            return None
+        return res if isinstance(res, dict) and 'orderId' in res else None
+
+    async def place_order(self, spec: ListingSpec) -> Optional[dict]:
+        '''
+        До открытия торгов MEXC отвечает ошибкой - повторяем с шагом cadence
+        не дольше TIMING['order_retry'] секунд. BUY не идемпотентен: если ответа нет
+        (таймаут, обрыв, 5xx), биржа могла ордер принять - перед повтором ищем его
+        по newClientOrderId.
+        '''
+        params = self.order_params(spec)
+        timelimit = dt.datetime.now() + dt.timedelta(seconds=TIMING['order_retry'])
+        while dt.datetime.now() <= timelimit:
+            ambiguous = False
+            try:
+                res = await asyncio.wait_for(self.__trade.post_order(dict(params)), timeout=spec.timeout)
+                if isinstance(res, dict) and 'orderId' in res:
+                    logger.success(f'{spec.key}: order placed {res["orderId"]}')
+                    return res
+                logger.warning(f'{spec.key}: order rejected {res}')
+                ambiguous = isinstance(res, dict) and res.get('code') in RETRYABLE_STATUS
+            except asyncio.TimeoutError:
+                logger.warning(f'TIMEOUT while placing order for {spec.key}')
+                ambiguous = True
+            except CircuitOpenError as e:
+                # запрос не отправлялся - искать нечего
+                logger.warning(f'{e}, order for {spec.key} not sent')
+            except Exception as e:
+                logger.error(f'Error while placing order for {spec.key}: {e!r}')
+                ambiguous = True
+            if ambiguous:
+                res = await self.find_order(spec)
+                if res is not None:
+                    logger.success(f'{spec.key}: order found after failure {res["orderId"]}')
+                    return res
+            await asyncio.sleep(spec.cadence)
+        logger.error(f'{spec.key}: order not placed in {TIMING["order_retry"]}s')
+        return None
+
+
+async def main(path: str = LISTINGS_FILE):
+    price_listener = PriceListener()
+    user = User(price_listener, {'ETH': 2, 'BTC': 1})  # noqa: F841 - наблюдатели хранятся по weakref
+    runtime = ListingRuntime(price_listener, path)
+    runtime.load()
+    logger.info(f'Следим за {path}, правки файла применяются без перезапуска')
+    await runtime.watch()
+
+
+if __name__ == '__main__':
+    import sys
+    asyncio.run(main(*sys.argv[1:]))
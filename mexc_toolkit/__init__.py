@@ -0,0 +1,37 @@
+# MEXC API toolkit with lazily loaded submodules
+
+import importlib
+
+'''
+Клиенты разложены по подмодулям и грузятся при первом обращении:
+`from mexc_toolkit import mexc_market` импортирует только _tool и market,
+а requests подгружается при первом HTTP-запросе.
+'''
+
+_SUBMODULES = {
+    'TOOL': '_tool',
+    'mexc_market': 'market',
+    'mexc_trade': 'trade',
+    'mexc_account': 'account',
+    'mexc_capital': 'capital',
+    'mexc_subaccount': 'subaccount',
+    'mexc_rebate': 'rebate',
+    'mexc_listenkey': 'listenkey',
+    'ResilientTransport': 'resilience',
+    'CircuitOpenError': 'resilience',
+}
+
+__all__ = list(_SUBMODULES)
+
+
+def __getattr__(name):
+    submodule = _SUBMODULES.get(name)
+    if submodule is None:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(f'.{submodule}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
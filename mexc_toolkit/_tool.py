@@ -0,0 +1,71 @@
+import hmac
+import hashlib
+from urllib.parse import urlencode, quote
+
+
+def _request(method, url, **kwargs):
+    # requests (~0.1 s на импорт) грузится при первом запросе, а не при импорте пакета
+    import requests
+    return requests.request(method, url, **kwargs)
+
+
+# ServerTime、Signature
+class TOOL(object):
+    transport = None
+
+    def _get_server_time(self):
+        return self._send('get', '{}{}'.format(self.hosts, '/api/v3/time')).json()['serverTime']
+
+    def _sign_v3(self, req_time, sign_params=None):
+        if sign_params:
+            sign_params = urlencode(sign_params, quote_via=quote)
+            to_sign = "{}&timestamp={}".format(sign_params, req_time)
+        else:
+            to_sign = "timestamp={}".format(req_time)
+        sign = hmac.new(self.mexc_secret.encode('utf-8'), to_sign.encode('utf-8'), hashlib.sha256).hexdigest()
+        return sign
+
+    def public_request(self, method, url, params=None):
+        url = '{}{}'.format(self.hosts, url)
+        return self._send(method, url, params=params)
+
+    def sign_request(self, method, url, params=None):
+        url = '{}{}'.format(self.hosts, url)
+        req_time = self._get_server_time()
+        if params:
+            params['signature'] = self._sign_v3(req_time=req_time, sign_params=params)
+        else:
+            params = {}
+            params['signature'] = self._sign_v3(req_time=req_time)
+        params['timestamp'] = req_time
+        headers = {
+            'x-mexc-apikey': self.mexc_key,
+            'Content-Type': 'application/json',
+        }
+        return self._send(method, url, params=params, headers=headers)
+
+    def _send(self, method, url, **kwargs):
+        # без таймаута зависшее соединение держит поток (и вызывающего) бесконечно
+        return _request(method, url, timeout=self._transport().timeout, **kwargs)
+
+    def _transport(self):
+        # hedging, повторы и circuit breaker - см. resilience.py
+        if self.transport is None:
+            from .resilience import ResilientTransport
+            self.transport = ResilientTransport()
+        return self.transport
+
+    async def public_request_async(self, method, url, params=None):
+        return await self._transport().request(
+            lambda: self.public_request(method, url, params=params),
+            endpoint=url,
+            idempotent=method == 'GET',
+        )
+
+    async def sign_request_async(self, method, url, params=None):
+        # sign_request дописывает подпись в params, поэтому на каждую попытку - копия
+        return await self._transport().request(
+            lambda: self.sign_request(method, url, params=dict(params) if params else None),
+            endpoint=url,
+            idempotent=method == 'GET',
+        )
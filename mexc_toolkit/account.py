@@ -0,0 +1,18 @@
+from ._tool import TOOL
+
+
+# Spot Account
+class mexc_account(TOOL):
+
+    def __init__(self, mexc_hosts, mexc_key, mexc_secret):
+        self.api = '/api/v3'
+        self.hosts = mexc_hosts
+        self.mexc_key = mexc_key
+        self.mexc_secret = mexc_secret
+
+    async def get_account_info(self):
+        """get account information"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/account')
+        response = await self.sign_request_async(method, url)
+        return response.json()
@@ -0,0 +1,123 @@
+from ._tool import TOOL
+
+
+# Capital
+class mexc_capital(TOOL):
+
+    def __init__(self, mexc_hosts, mexc_key, mexc_secret):
+        self.api = '/api/v3/capital'
+        self.hosts = mexc_hosts
+        self.mexc_key = mexc_key
+        self.mexc_secret = mexc_secret
+
+    def get_coinlist(self):
+        """get currency information"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/config/getall')
+        response = self.sign_request(method, url)
+        return response.json()
+
+    def post_withdraw(self, params):
+        """withdraw"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/withdraw/apply')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def cancel_withdraw(self, params):
+        """withdraw"""
+        method = 'DELETE'
+        url = '{}{}'.format(self.api, '/withdraw')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_deposit_list(self, params):
+        """deposit history list"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/deposit/hisrec')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_withdraw_list(self, params):
+        """withdraw history list"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/withdraw/history')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def post_deposit_address(self, params):
+        """generate deposit address"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/deposit/address')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_deposit_address(self, params):
+        """get deposit address"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/deposit/address')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_withdraw_address(self, params):
+        """get deposit address"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/withdraw/address')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def post_transfer(self, params):
+        """universal transfer"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/transfer')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_transfer_list(self, params):
+        """universal transfer history"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/transfer')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_transfer_list_byId(self, params):
+        """universal transfer history (by tranId)"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/transfer/tranId')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def post_transfer_internal(self, params):
+        """universal transfer"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/transfer/internal')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_transfer_internal_list(self, params=None):
+        """universal transfer"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/transfer/internal')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    async def get_smallAssets_list(self):
+        """small Assets convertible list"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/convert/list')
+        response = await self.sign_request_async(method, url)
+        return response.json()
+
+    async def post_smallAssets_convert(self, params):
+        """small Assets convert"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/convert')
+        response = await self.sign_request_async(method, url, params=params)
+        return response.json()
+
+    def get_smallAssets_history(self, params=None):
+        """small Assets convertible history"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/convert')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
@@ -0,0 +1,39 @@
+from ._tool import TOOL
+
+
+# WebSocket ListenKey
+class mexc_listenkey(TOOL):
+
+    def __init__(self, mexc_hosts, mexc_key, mexc_secret):
+        self.api = '/api/v3'
+        self.hosts = mexc_hosts
+        self.mexc_key = mexc_key
+        self.mexc_secret = mexc_secret
+
+    def post_listenKey(self):
+        """ generate ListenKey """
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/userDataStream')
+        response = self.sign_request(method, url)
+        return response.json()
+
+    def get_listenKey(self):
+        """ get valid ListenKey """
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/userDataStream')
+        response = self.sign_request(method, url)
+        return response.json()
+
+    def put_listenKey(self, params):
+        """ extend ListenKey validity """
+        method = 'PUT'
+        url = '{}{}'.format(self.api, '/userDataStream')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def delete_listenKey(self, params):
+        """ delete ListenKey """
+        method = 'DELETE'
+        url = '{}{}'.format(self.api, '/userDataStream')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
@@ -0,0 +1,88 @@
+from ._tool import TOOL
+
+
+# Market Data
+class mexc_market(TOOL):
+
+    def __init__(self, mexc_hosts):
+        self.api = '/api/v3'
+        self.hosts = mexc_hosts
+        self.method = 'GET'
+
+    def get_ping(self):
+        """test connectivity"""
+        url = '{}{}'.format(self.api, '/ping')
+        response = self.public_request(self.method, url)
+        return response.json()
+
+    def get_timestamp(self):
+        """get sever time"""
+        url = '{}{}'.format(self.api, '/time')
+        response = self.public_request(self.method, url)
+        return response.json()
+
+    async def get_defaultSymbols(self):
+        """get defaultSymbols"""
+        url = '{}{}'.format(self.api, '/defaultSymbols')
+        response = await self.public_request_async(self.method, url)
+        return response.json()
+
+    async def get_exchangeInfo(self, params=None):
+        """get exchangeInfo"""
+        url = '{}{}'.format(self.api, '/exchangeInfo')
+        response = await self.public_request_async(self.method, url, params=params)
+        return response.json()
+
+    def get_depth(self, params):
+        """get symbol depth"""
+        url = '{}{}'.format(self.api, '/depth')
+        response = self.public_request(self.method, url, params=params)
+        return response.json()
+
+    def get_deals(self, params):
+        """get current trade deals list"""
+        url = '{}{}'.format(self.api, '/trades')
+        response = self.public_request(self.method, url, params=params)
+        return response.json()
+
+    def get_aggtrades(self, params):
+        """get aggregate trades list"""
+        url = '{}{}'.format(self.api, '/aggTrades')
+        response = self.public_request(self.method, url, params=params)
+        return response.json()
+
+    def get_kline(self, params):
+        """get k-line data"""
+        url = '{}{}'.format(self.api, '/klines')
+        response = self.public_request(self.method, url, params=params)
+        return response.json()
+
+    def get_avgprice(self, params):
+        """get current average prcie(default : 5m)"""
+        url = '{}{}'.format(self.api, '/avgPrice')
+        response = self.public_request(self.method, url, params=params)
+        return response.json()
+
+    def get_24hr_ticker(self, params=None):
+        """get 24hr prcie ticker change statistics"""
+        url = '{}{}'.format(self.api, '/ticker/24hr')
+        response = self.public_request(self.method, url, params=params)
+        return response.json()
+
+    async def get_price(self, params=None):
+        """get symbol price ticker"""
+        url = '{}{}'.format(self.api, '/ticker/price')
+        response = await self.public_request_async(self.method, url, params=params)
+        return response.json()
+
+    def get_bookticker(self, params=None):
+        """get symbol order book ticker"""
+        url = '{}{}'.format(self.api, '/ticker/bookTicker')
+        response = self.public_request(self.method, url, params=params)
+        return response.json()
+
+    def get_ETF_info(self, params=None):
+        """get ETF information"""
+        url = '{}{}'.format(self.api, '/etf/info')
+        response = self.public_request(self.method, url, params=params)
+        return response.json()
@@ -0,0 +1,74 @@
+from ._tool import TOOL
+
+
+# Rebate
+class mexc_rebate(TOOL):
+
+    def __init__(self, mexc_hosts, mexc_key, mexc_secret):
+        self.api = '/api/v3/rebate'
+        self.hosts = mexc_hosts
+        self.mexc_key = mexc_key
+        self.mexc_secret = mexc_secret
+
+    def get_taxQuery(self, params=None):
+        """get the rebate commission record"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/taxQuery')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_rebate_detail(self, params=None):
+        """get rebate record details"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/detail')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_kickback_detail(self, params=None):
+        """get self-return record details"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/detail/kickback')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_inviter(self, params=None):
+        """get self-return record details"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/referCode')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_affiliate_commission(self, params=None):
+        """get affiliate commission history"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/affiliate/commission')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_affiliate_withdraw(self, params=None):
+        """get affiliate withdraw history"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/affiliate/withdraw')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_affiliate_commission_detail(self, params=None):
+        """get affiliate commission details"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/affiliate/commission/detail')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_affiliate_referral(self, params=None):
+        """get affiliate referral"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/affiliate/referral')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_affiliate_subaffiliates(self, params=None):
+        """get affiliate subaffiliates"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/affiliate/subaffiliates')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
@@ -0,0 +1,189 @@
+import asyncio
+import random
+import time
+from collections import deque
+from typing import Callable, Dict, Optional, Tuple
+
+'''
+Устойчивый транспорт для клиентов MEXC:
+- hedged requests: если читающий запрос не ответил за p95 задержки эндпоинта,
+  отправляется дубль и берется тот ответ, что пришел первым;
+- повторы идемпотентных запросов с экспоненциальной паузой и полным разбросом (full jitter);
+- circuit breaker на каждый эндпоинт: после failure_threshold ошибок подряд запросы
+  к нему не отправляются reset_timeout секунд, затем пропускается один пробный.
+
+Ошибкой считаются исключения сети и ответы 429/5xx; остальные 4xx - ответ как есть.
+Отмена запроса снаружи (wait_for) ошибкой эндпоинта не считается.
+'''
+
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class LatencyTracker:
+    def __init__(self, window: int = 256, percentile: float = 0.95, min_samples: int = 20):
+        self.__samples = deque(maxlen=window)
+        self.__percentile = percentile
+        self.__min_samples = min_samples
+        self.__cached: Optional[float] = None
+
+    def add(self, seconds: float) -> None:
+        self.__samples.append(seconds)
+        self.__cached = None
+
+    def quantile(self) -> Optional[float]:
+        if len(self.__samples) < self.__min_samples:
+            return None
+        if self.__cached is None:
+            ordered = sorted(self.__samples)
+            self.__cached = ordered[min(int(len(ordered) * self.__percentile), len(ordered) - 1)]
+        return self.__cached
+
+
+class CircuitBreaker:
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half-open'
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 10.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.__opened_at = 0.0
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN:
+            if time.monotonic() - self.__opened_at < self.reset_timeout:
+                return False
+            self.state = self.HALF_OPEN
+            return True
+        # в полуоткрытом состоянии уже идет пробный запрос
+        return self.state == self.CLOSED
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.failures = 0
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.__opened_at = time.monotonic()
+
+    def record_cancel(self) -> None:
+        # отмененный пробный запрос ничего не сказал об эндпоинте: ждем следующего пробного
+        if self.state == self.HALF_OPEN:
+            self.state = self.OPEN
+            self.__opened_at = time.monotonic()
+
+
+class ResilientTransport:
+    def __init__(self, retries: int = 2, backoff: float = 0.05, max_backoff: float = 1.0,
+                 hedge_delay: float = 0.2, failure_threshold: int = 5, reset_timeout: float = 10.0,
+                 connect_timeout: Optional[float] = None, read_timeout: Optional[float] = None):
+        '''
+        hedge_delay - задержка дубля, пока для эндпоинта не набралось статистики p95.
+        connect_timeout, read_timeout - таймауты HTTP-запроса (по умолчанию 5 и 25 hedge_delay):
+        поток asyncio.to_thread не отменить, поэтому зависший запрос должен упасть сам,
+        а не занимать поток пула навсегда.
+        '''
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.hedge_delay = hedge_delay
+        self.connect_timeout = connect_timeout if connect_timeout is not None else hedge_delay * 5
+        self.read_timeout = read_timeout if read_timeout is not None else hedge_delay * 25
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.latencies: Dict[str, LatencyTracker] = {}
+        self.hedges = 0
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        # в формате requests: (connect, read)
+        return self.connect_timeout, self.read_timeout
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        breaker = self.breakers.get(endpoint)
+        if breaker is None:
+            breaker = self.breakers[endpoint] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+        return breaker
+
+    def latency(self, endpoint: str) -> LatencyTracker:
+        tracker = self.latencies.get(endpoint)
+        if tracker is None:
+            tracker = self.latencies[endpoint] = LatencyTracker()
+        return tracker
+
+    @staticmethod
+    def __failed(response) -> bool:
+        return getattr(response, 'status_code', 200) in RETRYABLE_STATUS
+
+    async def __timed(self, send: Callable, endpoint: str):
+        start = time.monotonic()
+        response = await asyncio.to_thread(send)
+        if not self.__failed(response):
+            self.latency(endpoint).add(time.monotonic() - start)
+        return response
+
+    async def __hedged(self, send: Callable, endpoint: str):
+        tasks = [asyncio.ensure_future(self.__timed(send, endpoint))]
+        try:
+            delay = self.latency(endpoint).quantile() or self.hedge_delay
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return tasks[0].result()
+            self.hedges += 1
+            tasks.append(asyncio.ensure_future(self.__timed(send, endpoint)))
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None and not self.__failed(task.result()):
+                        return task.result()
+                    error = task
+            return error.result()
+        finally:
+            # вызывающий мог отменить запрос (wait_for) - не оставляем висящих задач
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # помечаем ошибку прочитанной
+
+    async def request(self, send: Callable, endpoint: str, idempotent: bool = True, hedge: bool = True):
+        '''
+        send - блокирующая функция без аргументов, возвращающая requests.Response.
+        Повторы и дубли - только для идемпотентных запросов.
+        '''
+        breaker = self.breaker(endpoint)
+        attempts = self.retries + 1 if idempotent else 1
+        for attempt in range(attempts):
+            if not breaker.allow():
+                raise CircuitOpenError(f'Circuit for {endpoint} is {breaker.state}')
+            try:
+                if idempotent and hedge:
+                    response = await self.__hedged(send, endpoint)
+                else:
+                    response = await self.__timed(send, endpoint)
+            except asyncio.CancelledError:
+                # отмена снаружи (wait_for) - не ошибка эндпоинта, но пробный запрос
+                # полуоткрытого состояния не должен держать цепь полуоткрытой вечно
+                breaker.record_cancel()
+                raise
+            except Exception:
+                breaker.record_failure()
+                if attempt == attempts - 1:
+                    raise
+            else:
+                if not self.__failed(response):
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                if attempt == attempts - 1:
+                    return response
+            await asyncio.sleep(random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt)))
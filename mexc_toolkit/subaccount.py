@@ -0,0 +1,60 @@
+from ._tool import TOOL
+
+
+# Sub-Account
+class mexc_subaccount(TOOL):
+
+    def __init__(self, mexc_hosts, mexc_key, mexc_secret):
+        self.api = '/api/v3'
+        self.hosts = mexc_hosts
+        self.mexc_key = mexc_key
+        self.mexc_secret = mexc_secret
+
+    def post_virtualSubAccount(self, params):
+        """create a sub-account"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/sub-account/virtualSubAccount')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_SubAccountList(self, params=None):
+        """get sub-account list"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/sub-account/list')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def post_virtualApiKey(self, params):
+        """create sub-account's apikey"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/sub-account/apiKey')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_virtualApiKey(self, params):
+        """get sub-account's apikey"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/sub-account/apiKey')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def delete_virtualApiKey(self, params):
+        """delete sub-account's apikey"""
+        method = 'DELETE'
+        url = '{}{}'.format(self.api, '/sub-account/apiKey')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def post_universalTransfer(self, params):
+        """universal transfer between accounts"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/capital/sub-account/universalTransfer')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_universalTransfer(self, params):
+        """universal transfer history between accounts"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/capital/sub-account/universalTransfer')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
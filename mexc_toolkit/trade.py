@@ -0,0 +1,110 @@
+from ._tool import TOOL
+
+
+# Spot Trade
+class mexc_trade(TOOL):
+
+    def __init__(self, mexc_hosts, mexc_key, mexc_secret):
+        self.api = '/api/v3'
+        self.hosts = mexc_hosts
+        self.mexc_key = mexc_key
+        self.mexc_secret = mexc_secret
+
+    def get_selfSymbols(self):
+        """get currency information"""
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/selfSymbols')
+        response = self.sign_request(method, url)
+        return response.json()
+
+    def post_order_test(self, params):
+        """test new order"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/order/test')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    async def post_order(self, params):
+        """place order"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/order')
+        response = await self.sign_request_async(method, url, params=params)
+        return response.json()
+
+    def post_batchorders(self, params):
+        """place batch orders(same symbol)"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/batchOrders')
+        params = {"batchOrders": str(params)}
+        response = self.sign_request(method, url, params=params)
+        print(response.url)
+        return response.json()
+
+    async def delete_order(self, params):
+        """
+        Cancel order
+        """
+        method = 'DELETE'
+        url = '{}{}'.format(self.api, '/order')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def delete_openorders(self, params):
+        """
+        cancel all order for a single symbol
+        """
+        method = 'DELETE'
+        url = '{}{}'.format(self.api, '/openOrders')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    async def get_order(self, params):
+        """
+        get order
+        'origClientOrderId' or 'orderId' must be sent
+        """
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/order')
+        response = await self.sign_request_async(method, url, params=params)
+        return response.json()
+
+    def get_openorders(self, params):
+        """get current pending order """
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/openOrders')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_allorders(self, params):
+        """
+        get current all order
+        startTime and endTime need to use at the same time
+        """
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/allOrders')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    async def get_mytrades(self, params):
+        """
+        get current all order
+        orderId need to use with symbol at the same time
+        """
+        method = 'GET'
+        url = '{}{}'.format(self.api, '/myTrades')
+        response = await self.sign_request_async(method, url, params=params)
+        return response.json()
+
+    def post_mxDeDuct(self, params):
+        """Enable MX DeDuct"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/mxDeduct/enable')
+        response = self.sign_request(method, url, params=params)
+        return response.json()
+
+    def get_mxDeDuct(self):
+        """MX DeDuct status"""
+        method = 'POST'
+        url = '{}{}'.format(self.api, '/mxDeduct/enable')
+        response = self.sign_request(method, url)
+        return response.json()
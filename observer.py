@@ -1,7 +1,12 @@
 # Observer Design Pattern
 
+import asyncio
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import List
+from contextlib import contextmanager
+
+from subject import Subject
 
 '''
 У нас есть класс WeatherData, который от физических датчиков регулярно получает
@@ -16,28 +21,22 @@ from typing import List
 Субъект всегда имеет последние данные.
 Наблюдатели (гаджеты) получают последние данные от субъекта.
 
+Датчики присылают данные пачками с высокой частотой, поэтому:
+- несколько set_measurements можно объединить в одно оповещение -
+  блоком `with weather_data.batch():` или окном coalesce_window (сек.).
+  Это свойство WeatherData, а не общего Subject: объединять можно только состояние
+  с набором измененных полей; события (ордера, балансы) склеивать нельзя;
+- наблюдатель при регистрации может указать поля (fields), которые ему нужны,
+  и будет оповещен только когда одно из этих полей изменилось.
+
+Субъект (общий для всех примеров, см. subject.py) дает три метода:
+register_observer - для регистрации наблюдателя в подписчиках
+                    (fields - поля, изменения которых нужны наблюдателю)
+remove_observer - для удаления наблюдателя из подписчиков
+notify_observers - для оповещения всех зарегистрированных наблюдателей
 '''
 
-
-class Subject(ABC):
-    '''
-    Реализует интерфейс субъекта - делает обязательными для
-    всех подклассов три следующие метода для работы с наблюдателями:
-    register_observer - для регистрации наблюдателя в подписчиках
-    remove_observer - для удаления наблюдателя из подписчиков
-    notify_observers - для оповещения всех зарегистрированных наблюдателей
-    '''
-    @abstractmethod
-    def register_observer(self, observer) -> None:
-        pass
-
-    @abstractmethod
-    def remove_observer(self, observer) -> None:
-        pass
-
-    @abstractmethod
-    def notify_observers(self) -> None:
-        pass
+FIELDS = ('temperature', 'humidity', 'pressure')
 
 
 class Observer(ABC):
@@ -52,36 +51,122 @@ class Observer(ABC):
 
 
 class WeatherData(Subject):
-    __observers: List[Observer]
+    notify_method = 'update'
     __temperature: float
     __humidity: float
     __pressure: float
 
-    def __init__(self):
-        self.__observers: List[Observer] = []
-
-    def register_observer(self, observer) -> None:
-        self.__observers.append(observer)
-
-    def remove_observer(self, observer) -> None:
-        self.__observers.remove(observer)
-
-    def notify_observers(self) -> None:
-        for observer in self.__observers:
-            observer.update(
-                temperature=self.__temperature,
-                humidity=self.__humidity,
-                pressure=self.__pressure,
-            )
+    def __init__(self, coalesce_window: float = 0.0):
+        '''
+        coalesce_window - не чаще одного оповещения за это число секунд;
+        отложенное оповещение отправляется в конце окна по таймеру
+        (loop.call_later, если работает цикл asyncio, иначе threading.Timer) или flush().
+        '''
+        super().__init__()
+        self.__coalesce_window = coalesce_window
+        self.__temperature = None
+        self.__humidity = None
+        self.__pressure = None
+        self.__batch_depth = 0
+        self.__changed = set(FIELDS)
+        self.__pending = False
+        self.__notified_at = float('-inf')
+        self.__timer = None
+        self.__timer_loop = None
+        self.__lock = threading.RLock()
+
+    def _notify_measurements(self) -> None:
+        changed = self.__changed
+        self.__changed = set()
+        self.__pending = False
+        self.notify_changed(
+            changed,
+            temperature=self.__temperature,
+            humidity=self.__humidity,
+            pressure=self.__pressure,
+        )
 
     def measurements_changed(self) -> None:
-        self.notify_observers()
+        with self.__lock:
+            self.__pending = True
+            if self.__batch_depth:
+                return
+            if self.__coalesce_window:
+                now = time.monotonic()
+                elapsed = now - self.__notified_at
+                if elapsed < self.__coalesce_window:
+                    # конец пачки: последние значения уйдут по таймеру
+                    self.__schedule_flush(self.__coalesce_window - elapsed)
+                    return
+                self.__notified_at = now
+            self._notify_measurements()
+
+    def flush(self) -> None:
+        # Отправить оповещение, отложенное окном coalesce_window;
+        # внутри batch() оно остается отложенным до выхода из блока
+        with self.__lock:
+            if self.__batch_depth:
+                return
+            self.__cancel_timer()
+            if self.__pending:
+                self.__notified_at = time.monotonic()
+                self._notify_measurements()
+
+    def __schedule_flush(self, delay: float) -> None:
+        if self.__timer is not None:
+            if self.__timer_loop is None or not self.__timer_loop.is_closed():
+                return
+            # цикл закрылся раньше, чем сработал call_later - таймер не сработает никогда
+            self.__cancel_timer()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.__timer = threading.Timer(delay, self.__timer_flush)
+            self.__timer.daemon = True
+            self.__timer.start()
+        else:
+            self.__timer = loop.call_later(delay, self.__timer_flush)
+            self.__timer_loop = loop
+
+    def __cancel_timer(self) -> None:
+        if self.__timer is not None:
+            self.__timer.cancel()
+        self.__timer = None
+        self.__timer_loop = None
+
+    def __timer_flush(self) -> None:
+        with self.__lock:
+            self.__timer = None
+            self.__timer_loop = None
+            self.flush()
+
+    @contextmanager
+    def batch(self):
+        '''
+        Все set_measurements внутри блока дают одно оповещение на выходе.
+        '''
+        with self.__lock:
+            self.__batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self.__lock:
+                self.__batch_depth -= 1
+                if not self.__batch_depth and self.__pending:
+                    self.measurements_changed()
 
     def set_measurements(self, temperature, humidity, pressure) -> None:
-        self.__temperature = temperature
-        self.__humidity = humidity
-        self.__pressure = pressure
-        self.measurements_changed()
+        with self.__lock:
+            if temperature != self.__temperature:
+                self.__changed.add('temperature')
+            if humidity != self.__humidity:
+                self.__changed.add('humidity')
+            if pressure != self.__pressure:
+                self.__changed.add('pressure')
+            self.__temperature = temperature
+            self.__humidity = humidity
+            self.__pressure = pressure
+            self.measurements_changed()
 
     def get_temperature(self) -> float:
         return self.__temperature
@@ -116,7 +201,7 @@ class Widget2(Observer):
 
     def __init__(self, weather_data: WeatherData):
         self.__weather_data = weather_data
-        weather_data.register_observer(self)
+        weather_data.register_observer(self, fields=('temperature',))
 
     def update(self, temperature, humidity, pressure) -> None:
         self.__temperature = temperature
@@ -130,6 +215,10 @@ def main():
 
     weather_data.set_measurements(28, 70, 30)
     weather_data.set_measurements(30, 81, 27)
+    weather_data.set_measurements(30, 75, 27)  # Widget2 не оповещается - температура прежняя
+    with weather_data.batch():  # одно оповещение на всю пачку
+        weather_data.set_measurements(31, 75, 27)
+        weather_data.set_measurements(32, 74, 28)
     weather_data.remove_observer(widget2)
     weather_data.set_measurements(24, 66, 33)
 
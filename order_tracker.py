@@ -0,0 +1,170 @@
+# Order lifecycle tracker driven by the user-data stream
+
+import asyncio
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from mexc_toolkit import mexc_trade
+from subject import Subject
+from user_stream import DEALS, ORDERS, RECONNECTED, StreamObserver, UserDataStream
+
+'''
+Вместо опроса mexc_trade.get_order / get_openorders (каждый опрос - подписанный
+запрос плюс /time) OrderTracker слушает приватный поток UserDataStream и держит
+в памяти индекс ордеров по orderId и clientOrderId вместе со сделками (fills).
+
+Ордер хранится в виде словаря с теми же ключами, что отдает REST:
+symbol, orderId, clientOrderId, side, type, price, origQty, executedQty, status, fills.
+
+С REST (get_openorders) индекс сверяется только после переподключения потока.
+Закрытый ордер (CLOSED) обратно в открытые не переходит: снимок REST может быть
+старше события, пришедшего по потоку, пока шел запрос.
+Наблюдатели получают order_updated(order, previous_status) при смене состояния.
+'''
+
+# Коды статуса из spot@private.orders.v3.api
+STATUS = {
+    1: 'NEW',
+    2: 'FILLED',
+    3: 'PARTIALLY_FILLED',
+    4: 'CANCELED',
+    5: 'PARTIALLY_CANCELED',
+}
+CLOSED = frozenset({'FILLED', 'CANCELED', 'PARTIALLY_CANCELED', 'EXPIRED', 'REJECTED'})
+SIDE = {1: 'BUY', 2: 'SELL'}
+ORDER_TYPE = {1: 'LIMIT', 2: 'POST_ONLY', 3: 'IMMEDIATE_OR_CANCEL', 4: 'FILL_OR_KILL', 5: 'MARKET'}
+
+
+class OrderObserver(ABC):
+    @abstractmethod
+    def order_updated(self, order: dict, previous_status: Optional[str]) -> None:
+        pass
+
+
+class OrderTracker(Subject, StreamObserver):
+    notify_method = 'order_updated'
+
+    def __init__(self, stream: UserDataStream, trade: mexc_trade, symbols: Iterable[str] = ()):
+        super().__init__()
+        self.__trade = trade
+        self.__orders: Dict[str, dict] = {}
+        self.__by_client_id: Dict[str, str] = {}
+        self.__open: Dict[str, dict] = {}
+        self.__symbols = set(symbols)
+        self.__reconcile: Optional[asyncio.Task] = None
+        stream.register_observer(self)
+
+    # --- Индекс ---
+
+    def get(self, order_id: Optional[str] = None, client_order_id: Optional[str] = None) -> Optional[dict]:
+        if order_id is None and client_order_id is not None:
+            order_id = self.__by_client_id.get(client_order_id)
+        return self.__orders.get(order_id)
+
+    def open_orders(self, symbol: Optional[str] = None) -> List[dict]:
+        return [order for order in self.__open.values() if symbol is None or order['symbol'] == symbol]
+
+    def fills(self, order_id: str) -> List[dict]:
+        order = self.__orders.get(order_id)
+        return order['fills'] if order else []
+
+    def track(self, order: dict) -> dict:
+        '''
+        Добавляет ордер из REST-ответа (post_order, get_order, get_openorders).
+        '''
+        return self.__apply(str(order['orderId']), order['symbol'], {
+            'clientOrderId': order.get('clientOrderId') or order.get('origClientOrderId') or '',
+            'side': order.get('side'),
+            'type': order.get('type'),
+            'price': order.get('price'),
+            'origQty': order.get('origQty'),
+            'executedQty': order.get('executedQty', '0'),
+            'status': order.get('status', 'NEW'),
+        })
+
+    def __apply(self, order_id: str, symbol: str, fields: dict) -> dict:
+        order = self.__orders.get(order_id)
+        previous = None
+        if order is None:
+            order = {'symbol': symbol, 'orderId': order_id, 'fills': []}
+            self.__orders[order_id] = order
+            self.__symbols.add(symbol)
+        else:
+            previous = order.get('status')
+            if previous in CLOSED and fields.get('status') not in CLOSED:
+                # REST-снимок (reconcile) старше события потока: закрытый ордер не открываем
+                return order
+        order.update({key: value for key, value in fields.items() if value is not None})
+        if order.get('clientOrderId'):
+            self.__by_client_id[order['clientOrderId']] = order_id
+        if order['status'] in CLOSED:
+            self.__open.pop(order_id, None)
+        else:
+            self.__open[order_id] = order
+        if order['status'] != previous:
+            self.notify_observers(order, previous)
+        return order
+
+    # --- Поток ---
+
+    def stream_event(self, channel: str, message: Optional[dict]) -> None:
+        if channel == ORDERS:
+            self.__on_order(message['s'], message['d'])
+        elif channel == DEALS:
+            self.__on_deal(message['s'], message['d'])
+        elif channel == RECONNECTED:
+            if self.__reconcile is None or self.__reconcile.done():
+                self.__reconcile = asyncio.get_running_loop().create_task(self.reconcile())
+
+    def __on_order(self, symbol: str, data: dict) -> None:
+        self.__apply(str(data['i']), symbol, {
+            'clientOrderId': data.get('c'),
+            'side': SIDE.get(data.get('S')),
+            'type': ORDER_TYPE.get(data.get('o')),
+            'price': data.get('p'),
+            'origQty': data.get('v'),
+            'executedQty': data.get('cv'),
+            'status': STATUS.get(data.get('s'), 'NEW'),
+        })
+
+    def __on_deal(self, symbol: str, data: dict) -> None:
+        order_id = str(data['i'])
+        order = self.__orders.get(order_id)
+        if order is None:
+            # сделка пришла раньше события ордера
+            order = self.__apply(order_id, symbol, {'clientOrderId': data.get('c'), 'status': 'NEW'})
+        order['fills'].append({
+            'tradeId': data.get('t'),
+            'price': data.get('p'),
+            'qty': data.get('v'),
+            'commission': data.get('n'),
+            'commissionAsset': data.get('N'),
+            'time': data.get('T'),
+        })
+
+    # --- Сверка после переподключения ---
+
+    async def reconcile(self) -> None:
+        logger.debug(f'Reconciling open orders for {sorted(self.__symbols)}')
+        for symbol in list(self.__symbols):
+            try:
+                rest = await asyncio.to_thread(self.__trade.get_openorders, {'symbol': symbol})
+            except Exception as e:
+                logger.error(f'get_openorders failed for {symbol}: {e!r}')
+                continue
+            if not isinstance(rest, list):
+                logger.error(f'get_openorders failed for {symbol}: {rest}')
+                continue
+            alive = set()
+            for order in rest:
+                alive.add(str(order['orderId']))
+                self.track(order)
+            # Закрылись, пока поток лежал: узнаем итоговое состояние
+            for order_id in [oid for oid, order in self.__open.items()
+                             if order['symbol'] == symbol and oid not in alive]:
+                try:
+                    self.track(await self.__trade.get_order({'symbol': symbol, 'orderId': order_id}))
+                except Exception as e:
+                    logger.error(f'get_order failed for {order_id}: {e!r}')
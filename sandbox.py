@@ -1,26 +1,13 @@
 # Simple Example
+# loguru (~20 мс импорта) не откладываем: это скрипт, и main настраивает логгер первым делом
 from loguru import logger
 import asyncio
 import datetime as dt
 from abc import ABC, abstractmethod
-from typing import List, Dict
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from typing import Dict
 
-from mexc_toolkit import mexc_market
-
-
-class Subject(ABC):
-    @abstractmethod
-    def register_observer(self, observer) -> None:
-        pass
-
-    @abstractmethod
-    def remove_observer(self, observer) -> None:
-        pass
-
-    @abstractmethod
-    def notify_users(self) -> None:
-        pass
+from mexc_toolkit import CircuitOpenError, mexc_market
+from subject import Subject
 
 
 class Observer(ABC):
@@ -30,21 +17,16 @@ class Observer(ABC):
 
 
 class Listing(Subject):
-    def __init__(self):
-        self.__users: List[Observer] = []
+    notify_method = 'update'
+
+    def __init__(self, hosts='https://api.mexc.com'):
+        super().__init__()
         self.__data: Dict[str, float] = {}
-        self.__mexc = mexc_market('https://api.mexc.com')
+        self.__mexc = mexc_market(hosts)
         self.running_state = True
 
-    def register_observer(self, observer) -> None:
-        self.__users.append(observer)
-
-    def remove_observer(self, observer) -> None:
-        self.__users.remove(observer)
-
     def notify_users(self) -> None:
-        for user in self.__users:
-            user.update(self.__data)
+        self.notify_observers(self.__data)
 
     def data_changed(self) -> None:
         self.notify_users()
@@ -64,8 +46,10 @@ class Listing(Subject):
                 self.data_changed()
             except asyncio.TimeoutError:
                 print(dt.datetime.now().strftime("%H:%M:%S"), 'TIMEOUT while MEXC price waiting!')
+            except CircuitOpenError as e:
+                print(dt.datetime.now().strftime("%H:%M:%S"), f'{e}, skipping {symbol}')
             except Exception as e:
-                print(dt.datetime.now().strftime("%H:%M:%S"), f'Error: {e}')
+                print(dt.datetime.now().strftime("%H:%M:%S"), f'Error: {e!r}')
             await asyncio.sleep(feedback_time)
         del self.__data[symbol]
         print(dt.datetime.now().strftime("%H:%M:%S"), f'STOP running FETCH_PRICE for {symbol}')
@@ -83,6 +67,8 @@ class User(Observer):
 
 
 async def main():
+    from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
     logger.remove()  # Удаляем стандартный обработчик
     logger.add(
         lambda msg: print(msg, end=""),
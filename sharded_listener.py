@@ -0,0 +1,238 @@
+# Sharded MEXC Subject: worker processes + shared-memory price snapshot
+
+import asyncio
+import multiprocessing as mp
+import time
+from collections.abc import Mapping
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from loguru import logger
+
+from mexc_toolkit import mexc_market
+
+from config import RESPONSE_MAX_TIME
+from subject import Subject
+
+'''
+Один цикл asyncio с PriceListener упирается в одно ядро (JSON + колбэки наблюдателей).
+Здесь символы делятся между процессами-воркерами (шардами). Каждый воркер одним запросом
+берет цены всех символов и пишет цены своих в общий массив в shared memory по ID символа.
+Наблюдатели получают SharedPriceSnapshot - Mapping поверх этой памяти, без копий.
+
+Раскладка памяти: три колонки по N ячеек -
+    seq   (uint64)  - seqlock: нечетный во время записи, четный после
+    price (float64)
+    ts    (float64) - время записи, time.time()
+У каждого символа ровно один писатель (его шард), поэтому seqlock достаточно.
+'''
+
+_SLOT = 8
+_SPIN = 100           # попыток чтения слота до того, как уступать процессор
+_READ_TIMEOUT = 0.5   # дальше слот считается брошенным посреди записи
+
+
+class SharedPriceSnapshot(Mapping):
+    def __init__(self, symbols: Sequence[str], name: Optional[str] = None, untrack: bool = False):
+        self.symbols: List[str] = list(symbols)
+        self.symbol_ids: Dict[str, int] = {symbol: i for i, symbol in enumerate(self.symbols)}
+        size = max(len(self.symbols), 1) * _SLOT * 3
+        self.owner = name is None
+        self.__shm = SharedMemory(name=name, create=self.owner, size=size)
+        if untrack:
+            # процесс со своим resource_tracker иначе удалит чужой сегмент при выходе
+            resource_tracker.unregister(self.__shm._name, 'shared_memory')
+        n = len(self.symbols)
+        buf = self.__shm.buf
+        self.seq = buf[:n * _SLOT].cast('Q')
+        self.prices = buf[n * _SLOT:2 * n * _SLOT].cast('d')
+        self.timestamps = buf[2 * n * _SLOT:3 * n * _SLOT].cast('d')
+        if self.owner:
+            buf[:size] = bytes(size)
+
+    @classmethod
+    def attach(cls, name: str, symbols: Sequence[str], untrack: bool = False) -> 'SharedPriceSnapshot':
+        '''
+        Подключение к уже созданному снимку. Воркеры ShardedPriceListener делят
+        resource_tracker с владельцем; посторонние процессы передают untrack=True.
+        '''
+        return cls(symbols, name=name, untrack=untrack)
+
+    @property
+    def name(self) -> str:
+        return self.__shm.name
+
+    def write(self, slot: int, price: float, ts: Optional[float] = None) -> None:
+        seq = self.seq[slot]
+        self.seq[slot] = seq + 1
+        self.prices[slot] = price
+        self.timestamps[slot] = time.time() if ts is None else ts
+        self.seq[slot] = seq + 2
+
+    def read(self, slot: int):
+        # Запись - несколько сохранений, поэтому сначала короткий спин, потом уступаем
+        # процессор. Если писатель умер посреди записи, seq останется нечетным - не висим вечно.
+        attempt, deadline = 0, None
+        while True:
+            seq = self.seq[slot]
+            if not seq & 1:
+                price, ts = self.prices[slot], self.timestamps[slot]
+                if self.seq[slot] == seq:
+                    return price, ts
+            attempt += 1
+            if attempt > _SPIN:
+                if deadline is None:
+                    deadline = time.monotonic() + _READ_TIMEOUT
+                elif time.monotonic() > deadline:
+                    raise TimeoutError(f'Price slot {self.symbols[slot]} is stuck mid-write')
+                time.sleep(0)
+
+    def repair(self) -> int:
+        '''
+        Владелец после остановки воркеров: слоты, брошенные посреди записи, снова читаемы.
+        '''
+        seq = self.seq
+        stuck = [slot for slot in range(len(seq)) if seq[slot] & 1]
+        for slot in stuck:
+            seq[slot] += 1
+        return len(stuck)
+
+    def versions(self) -> bytes:
+        return self.seq.tobytes()
+
+    def close(self) -> None:
+        self.seq.release()
+        self.prices.release()
+        self.timestamps.release()
+        self.__shm.close()
+        if self.owner:
+            self.__shm.unlink()
+
+    # Mapping: symbol -> последняя цена, только для уже записанных символов
+    def __getitem__(self, symbol: str) -> float:
+        slot = self.symbol_ids[symbol]
+        if not self.seq[slot]:
+            raise KeyError(symbol)
+        return self.read(slot)[0]
+
+    def __iter__(self) -> Iterator[str]:
+        seq = self.seq
+        return (symbol for i, symbol in enumerate(self.symbols) if seq[i])
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __contains__(self, symbol) -> bool:
+        slot = self.symbol_ids.get(symbol)
+        return slot is not None and self.seq[slot] != 0
+
+
+def shard_symbols(symbols: Sequence[str], shards: int) -> List[List[str]]:
+    return [list(symbols[i::shards]) for i in range(shards)]
+
+
+async def _poll_shard(snapshot: SharedPriceSnapshot, symbols: Sequence[str], hosts: str,
+                      interval: float, stop_event) -> None:
+    # Один запрос /ticker/price без symbol за интервал: биржа отдает цены всех символов,
+    # шард пишет свои. Запрос на каждый символ занимал бы по потоку пула на символ.
+    mexc = mexc_market(hosts)
+    slots = {symbol: snapshot.symbol_ids[symbol] for symbol in symbols}
+    while not stop_event.is_set():
+        try:
+            tickers = await asyncio.wait_for(mexc.get_price(), timeout=RESPONSE_MAX_TIME)
+            for ticker in tickers:
+                slot = slots.get(ticker['symbol'])
+                if slot is not None:
+                    snapshot.write(slot, float(ticker['price']))
+        except asyncio.TimeoutError:
+            logger.warning(f'TIMEOUT while MEXC prices waiting for {len(slots)} symbols')
+        except Exception as e:
+            logger.error(f'Error while fetching prices: {e!r}')
+        await asyncio.sleep(interval)
+
+
+def _shard_worker(name: str, all_symbols: Sequence[str], symbols: Sequence[str], hosts: str,
+                  interval: float, stop_event) -> None:
+    snapshot = SharedPriceSnapshot.attach(name, all_symbols)
+    try:
+        asyncio.run(_poll_shard(snapshot, symbols, hosts, interval, stop_event))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        snapshot.close()
+
+
+class ShardedPriceListener(Subject):
+    '''
+    Тот же Subject, что и PriceListener, но символы опрашиваются в `shards` процессах.
+    Наблюдатели получают в price_updated общий SharedPriceSnapshot (Mapping symbol -> price).
+    '''
+    notify_method = 'price_updated'
+
+    def __init__(self, symbols: Sequence[str], shards: Optional[int] = None,
+                 hosts='https://api.mexc.com', interval: float = RESPONSE_MAX_TIME):
+        super().__init__()
+        self.__hosts = hosts
+        self.__interval = interval
+        self.__shards = shards or mp.cpu_count()
+        self.__stop = mp.Event()
+        self.__workers: List[mp.Process] = []
+        self.snapshot = SharedPriceSnapshot(symbols)
+
+    def notify_users(self) -> None:
+        self.notify_observers(self.snapshot)
+
+    def start(self) -> None:
+        symbols = self.snapshot.symbols
+        for shard in shard_symbols(symbols, self.__shards):
+            if not shard:
+                continue
+            worker = mp.Process(
+                target=_shard_worker,
+                args=(self.snapshot.name, symbols, shard, self.__hosts, self.__interval, self.__stop),
+                daemon=True,
+            )
+            worker.start()
+            self.__workers.append(worker)
+        logger.debug(f'Started {len(self.__workers)} price shards for {len(symbols)} symbols')
+
+    def stop(self) -> None:
+        self.__stop.set()
+        for worker in self.__workers:
+            worker.join(timeout=RESPONSE_MAX_TIME * 4)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+        self.__workers.clear()
+        stuck = self.snapshot.repair()
+        if stuck:
+            logger.warning(f'{stuck} price slots were left mid-write by terminated shards')
+        self.snapshot.close()
+
+    async def watch(self, duration: float, interval: float = 0.01) -> None:
+        # Оповещает наблюдателей, когда хоть один шард записал новую цену
+        timelimit = time.monotonic() + duration
+        versions = self.snapshot.versions()
+        while time.monotonic() <= timelimit:
+            await asyncio.sleep(interval)
+            current = self.snapshot.versions()
+            if current != versions:
+                versions = current
+                self.notify_users()
+
+
+async def main():
+    from try_mexc import User
+
+    listener = ShardedPriceListener(['BTCUSDT', 'ETHUSDT', 'MXUSDT'], shards=2)
+    user1 = User(listener, {'ETH': 2, 'BTC': 1})
+    listener.start()
+    try:
+        await listener.watch(duration=10)
+    finally:
+        listener.stop()
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,151 @@
+# Triangular spread scanner over bookTicker for the whole symbol universe
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from array import array
+from itertools import compress
+from operator import itemgetter, mul
+from typing import Dict, List, Tuple
+
+from loguru import logger
+
+from config import STABLE
+from mexc_toolkit import mexc_market
+from subject import Subject
+
+'''
+mexc_market.get_bookticker без параметров отдает лучший bid/ask по всем символам
+за один запрос. SpreadScanner держит их в таблице (array по ID символа) и на
+каждом тике проверяет все треугольники через STABLE:
+
+    STABLE -> A -> B -> STABLE
+
+Граф пар строится один раз из exchangeInfo. Каждый шаг X -> Y - это либо покупка Y
+за X по ask (пара Y/X), либо продажа X за Y по bid (пара X/Y), поэтому для шага
+хранится индекс в массиве курсов rates: rates[2*id] = bid, rates[2*id+1] = 1/ask.
+Доходность пути - произведение трех курсов (и комиссий).
+Все пути считаются "векторно": itemgetter по заранее собранным индексам
+и map(mul, ...) работают в C, без питоновского цикла по путям.
+
+Наблюдатели получают spread_found(opportunities), когда доходность пути пересекает
+порог вверх: [(('USDT', 'A', 'B', 'USDT'), ('AUSDT', 'BA', 'BUSDT'), 0.0042), ...].
+'''
+
+
+_BOOK_FIELDS = itemgetter('symbol', 'bidPrice', 'askPrice')
+
+
+class SpreadObserver(ABC):
+    @abstractmethod
+    def spread_found(self, opportunities: List[Tuple[tuple, tuple, float]]) -> None:
+        pass
+
+
+class SpreadScanner(Subject):
+    notify_method = 'spread_found'
+
+    def __init__(self, exchange_info: dict, threshold: float = 0.001, fee: float = 0.0,
+                 stable: str = STABLE):
+        super().__init__()
+        self.threshold = threshold
+        symbols = [
+            item for item in exchange_info['symbols']
+            if str(item.get('status', '1')) in ('1', 'ENABLED', 'TRADING')
+        ]
+        self.symbols: List[str] = [item['symbol'] for item in symbols]
+        self.symbol_ids: Dict[str, int] = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.bids = array('d', bytes(8 * len(self.symbols)))
+        self.asks = array('d', bytes(8 * len(self.symbols)))
+        self.__rates = [0.0] * (2 * len(self.symbols))
+        self.__fee_factor = (1 - fee) ** 3
+        self.__active = set()
+        self.__build_paths(symbols, stable)
+
+    @classmethod
+    async def create(cls, market: mexc_market, **kwargs) -> 'SpreadScanner':
+        return cls(await market.get_exchangeInfo(), **kwargs)
+
+    def __build_paths(self, symbols: List[dict], stable: str) -> None:
+        # edges[X][Y] - индекс курса в rates для обмена X -> Y
+        edges: Dict[str, Dict[str, int]] = {}
+        for item in symbols:
+            i = self.symbol_ids[item['symbol']]
+            base, quote = item['baseAsset'], item['quoteAsset']
+            edges.setdefault(base, {})[quote] = 2 * i       # продать base по bid
+            edges.setdefault(quote, {})[base] = 2 * i + 1   # купить base по ask
+        paths, legs = [], ([], [], [])
+        from_stable = edges.get(stable, {})
+        for a, first in from_stable.items():
+            for b, second in edges.get(a, {}).items():
+                if b == stable or b == a:
+                    continue
+                third = edges.get(b, {}).get(stable)
+                if third is None:
+                    continue
+                paths.append((stable, a, b, stable))
+                for leg, rate in zip(legs, (first, second, third)):
+                    leg.append(rate)
+        self.paths: List[Tuple[str, str, str, str]] = paths
+        self.path_symbols = [
+            tuple(self.symbols[rate // 2] for rate in rates) for rates in zip(*legs)
+        ]
+        # itemgetter с одним индексом возвращает значение, а не кортеж
+        self.__legs = [
+            itemgetter(*leg) if len(leg) > 1 else (lambda rates, i=leg[0]: (rates[i],))
+            for leg in legs
+        ] if paths else []
+        logger.debug(f'SpreadScanner: {len(self.symbols)} symbols, {len(paths)} triangular paths via {stable}')
+
+    def update(self, book: List[dict]) -> None:
+        '''
+        book - ответ get_bookticker(): [{'symbol', 'bidPrice', 'askPrice', ...}, ...]
+        '''
+        ids, bids, asks, rates = self.symbol_ids, self.bids, self.asks, self.__rates
+        for symbol, bid, ask in map(_BOOK_FIELDS, book):
+            i = ids.get(symbol)
+            if i is None:
+                continue
+            bid = float(bid or 0)
+            ask = float(ask or 0)
+            bids[i] = bid
+            asks[i] = ask
+            i += i
+            rates[i] = bid
+            rates[i + 1] = 1 / ask if ask else 0.0
+
+    def evaluate(self) -> List[float]:
+        # Доходность каждого пути (1.0 - в ноль), в порядке self.paths
+        if not self.__legs:
+            return []
+        rates = self.__rates
+        first, second, third = (leg(rates) for leg in self.__legs)
+        products = map(mul, map(mul, first, second), third)
+        if self.__fee_factor != 1:
+            products = map(self.__fee_factor.__mul__, products)
+        return list(products)
+
+    def scan(self) -> List[Tuple[tuple, tuple, float]]:
+        returns = self.evaluate()
+        level = 1 + self.threshold
+        active = set(compress(range(len(returns)), map(level.__lt__, returns)))
+        crossed = active - self.__active
+        self.__active = active
+        opportunities = [
+            (self.paths[i], self.path_symbols[i], returns[i] - 1)
+            for i in sorted(crossed, key=returns.__getitem__, reverse=True)
+        ]
+        if opportunities:
+            self.notify_observers(opportunities)
+        return opportunities
+
+    async def poll(self, market: mexc_market, duration: float, interval: float = 1.0) -> None:
+        timelimit = time.monotonic() + duration
+        while time.monotonic() <= timelimit:
+            try:
+                book = await asyncio.to_thread(market.get_bookticker)
+                self.update(book)
+                self.scan()
+            except Exception as e:
+                logger.error(f'bookTicker scan failed: {e!r}')
+            await asyncio.sleep(interval)
@@ -0,0 +1,146 @@
+# Shared Subject for every Observer example in the repo
+
+import asyncio
+import inspect
+import weakref
+from typing import Dict, Iterable, Optional, Tuple
+
+'''
+Общий субъект для observer.py, sandbox.py, try_mexc.py и всех, кто от них наследуется.
+
+- Наблюдатели хранятся по слабым ссылкам: забытый наблюдатель сам пропадает из подписчиков.
+- Подписчики лежат в dict по id наблюдателя, поэтому удаление - O(1).
+- Оповещение идет по неизменяемому снимку (tuple), который пересобирается только после
+  изменения подписок (copy-on-write), поэтому итерация не требует блокировок, а
+  удаление/добавление наблюдателя во время оповещения безопасно.
+- Наблюдатель может подписаться только на часть полей (fields) - см. notify_changed.
+- notify_observers_async дожидается наблюдателей, у которых метод - корутина.
+
+Имя метода наблюдателя задает подкласс в notify_method ('update', 'price_updated', ...).
+'''
+
+
+# Подписка - список [ref, func, fields]: слабая ссылка на наблюдателя, функция метода
+# из его класса и поля. Список, а не объект - распаковка в цикле дешевле атрибутов.
+# При удалении ref подменяется на _dead, так что текущий снимок его уже не вызовет.
+_REF, _FUNC, _FIELDS = range(3)
+
+
+def _dead() -> None:
+    return None
+
+
+class Subject:
+    notify_method = 'update'
+
+    __registry: Dict[int, list]
+    __snapshot: Optional[Tuple[list, ...]]
+    __by_field: Optional[Dict[str, Tuple[list, ...]]]
+
+    def __init__(self):
+        self.__registry = {}
+        self.__snapshot = ()
+        self.__by_field = {}
+
+    def register_observer(self, observer, fields: Optional[Iterable[str]] = None) -> None:
+        key = id(observer)
+        registry = self.__registry
+
+        def forget(_, key=key) -> None:
+            entry = registry.get(key)
+            if entry is not None and entry[_REF] is ref:
+                self.__drop(key)
+
+        ref = weakref.ref(observer, forget)
+        func = getattr(type(observer), self.notify_method)
+        if key in registry:
+            self.__drop(key)
+        registry[key] = [ref, func, frozenset(fields) if fields is not None else None]
+        self.__invalidate()
+
+    def remove_observer(self, observer) -> None:
+        if id(observer) not in self.__registry:
+            raise ValueError(f'{observer!r} is not registered')
+        self.__drop(id(observer))
+
+    def __drop(self, key: int) -> None:
+        self.__registry.pop(key)[_REF] = _dead
+        self.__invalidate()
+
+    def __invalidate(self) -> None:
+        self.__snapshot = None
+        self.__by_field = None
+
+    def _snapshot(self) -> Tuple[list, ...]:
+        snapshot = self.__snapshot
+        if snapshot is None:
+            snapshot = self.__snapshot = tuple(self.__registry.values())
+        return snapshot
+
+    def __field_index(self) -> Dict[str, Tuple[list, ...]]:
+        # Поле -> подписчики в порядке регистрации (включая подписанных на все поля)
+        index = self.__by_field
+        if index is None:
+            entries = self._snapshot()
+            names = set()
+            for entry in entries:
+                names.update(entry[_FIELDS] or ())
+            index = self.__by_field = {
+                name: tuple(entry for entry in entries if entry[_FIELDS] is None or name in entry[_FIELDS])
+                for name in names
+            }
+        return index
+
+    def observers(self) -> list:
+        return [observer for observer in (entry[_REF]() for entry in self._snapshot())
+                if observer is not None]
+
+    @staticmethod
+    def _call(entries, args, kwargs) -> None:
+        if kwargs:
+            for ref, func, _ in entries:
+                observer = ref()
+                if observer is not None:
+                    func(observer, *args, **kwargs)
+        else:
+            for ref, func, _ in entries:
+                observer = ref()
+                if observer is not None:
+                    func(observer, *args)
+
+    @staticmethod
+    def _call_collect(entries, args, kwargs) -> list:
+        results = []
+        for ref, func, _ in entries:
+            observer = ref()
+            if observer is not None:
+                results.append(func(observer, *args, **kwargs))
+        return results
+
+    def __select(self, changed: Optional[Iterable[str]]):
+        entries = self._snapshot()
+        if changed is None:
+            return entries
+        index = self.__field_index()
+        if not index:
+            return entries
+        changed = tuple(changed)
+        if len(changed) == 1:
+            return index.get(changed[0], tuple(entry for entry in entries if entry[_FIELDS] is None))
+        return tuple(entry for entry in entries
+                     if entry[_FIELDS] is None or not entry[_FIELDS].isdisjoint(changed))
+
+    def notify_observers(self, *args, **kwargs) -> None:
+        self._call(self._snapshot(), args, kwargs)
+
+    def notify_changed(self, changed: Optional[Iterable[str]], *args, **kwargs) -> None:
+        '''
+        Оповещает подписанных на все поля и тех, чьи fields пересекаются с changed.
+        '''
+        self._call(self.__select(changed), args, kwargs)
+
+    async def notify_observers_async(self, *args, changed: Optional[Iterable[str]] = None, **kwargs) -> None:
+        results = self._call_collect(self.__select(changed), args, kwargs)
+        pending = [result for result in results if inspect.isawaitable(result)]
+        if pending:
+            await asyncio.gather(*pending)
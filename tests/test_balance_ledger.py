@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+import balance_ledger
+from balance_ledger import BalanceLedger, StaleBalanceError
+from user_stream import ACCOUNT, DEALS, RECONNECTED, UserDataStream
+
+
+class FlakyAccount:
+    '''
+    Первые failures вызовов падают; во время каждого вызова по потоку приходят events.
+    '''
+    def __init__(self, stream: UserDataStream, failures: int, events=None):
+        self.stream = stream
+        self.failures = failures
+        self.events = events
+        self.calls = 0
+
+    async def get_account_info(self):
+        self.calls += 1
+        events = self.events or [(ACCOUNT, {'d': {'a': 'USDT', 'f': str(self.calls), 'l': '0'}})]
+        for channel, message in events:
+            self.stream.notify_observers(channel, message)
+        await asyncio.sleep(0)
+        if self.calls <= self.failures:
+            raise ConnectionError('boom')
+        return {'balances': [{'asset': 'BTC', 'free': '1', 'locked': '0'},
+                             {'asset': 'USDT', 'free': '1000', 'locked': '0'}]}
+
+
+class Recorder:
+    def __init__(self):
+        self.updates = []
+
+    def balance_updated(self, asset, free, locked):
+        self.updates.append((asset, free, locked))
+
+
+def test_failed_seed_keeps_buffered_events():
+    stream = UserDataStream(listenkey=None)
+    ledger = BalanceLedger(stream, FlakyAccount(stream, failures=1))
+    recorder = Recorder()
+    ledger.register_observer(recorder)
+    with pytest.raises(ConnectionError):
+        asyncio.run(ledger.seed())
+    assert not ledger.valid
+    assert recorder.updates == [('USDT', 1.0, 0.0)]
+    with pytest.raises(StaleBalanceError):
+        ledger.free('USDT')
+    with pytest.raises(StaleBalanceError):
+        ledger.balances()
+
+
+def test_reseed_retries_until_success(monkeypatch):
+    monkeypatch.setattr(balance_ledger, 'RESEED_BACKOFF', 0.001)
+    stream = UserDataStream(listenkey=None)
+    account = FlakyAccount(stream, failures=3)
+    ledger = BalanceLedger(stream, account)
+
+    async def run():
+        stream.notify_observers(RECONNECTED, None)
+        for _ in range(200):
+            if ledger.valid:
+                break
+            await asyncio.sleep(0.005)
+
+    asyncio.run(run())
+    assert ledger.valid
+    assert account.calls == 4
+    assert ledger.free('BTC') == 1.0
+    assert ledger.free('USDT') == 4.0
+
+
+def test_fills_during_seed_are_not_counted_twice():
+    stream = UserDataStream(listenkey=None)
+    fill = {'s': 'BTCUSDT', 'd': {'v': '0.5', 'p': '100', 'S': 1}}
+    account = FlakyAccount(stream, failures=0, events=[(DEALS, fill)])
+    ledger = BalanceLedger(stream, account, apply_fills=True)
+    asyncio.run(ledger.seed())
+    # снимок уже учитывает сделку, пришедшую во время seed
+    assert ledger.balances() == {'BTC': (1.0, 0.0), 'USDT': (1000.0, 0.0)}
+
+    stream.notify_observers(DEALS, fill)
+    assert ledger.free('BTC') == 1.5
+    assert ledger.free('USDT') == 950.0
@@ -0,0 +1,50 @@
+import asyncio
+import json
+
+from capital_pipeline import CONVERTED, DONE_BEFORE, CapitalPipeline
+
+
+class FakeCapital:
+    def __init__(self, assets, failing=()):
+        self.assets = list(assets)
+        self.failing = set(failing)
+        self.converted = []
+
+    async def get_smallAssets_list(self):
+        return [{'asset': asset} for asset in self.assets]
+
+    async def post_smallAssets_convert(self, params):
+        batch = params['asset'].split(',')
+        self.converted.extend(asset for asset in batch if asset not in self.failing)
+        return {'failedList': [{'asset': asset} for asset in batch if asset in self.failing]}
+
+
+def test_new_sweep_starts_a_new_journal(tmp_path):
+    journal = tmp_path / 'journal.json'
+    capital = FakeCapital(['A', 'B'], failing={'B'})  # B не конвертируется никогда
+    runs = set()
+    for _ in range(3):
+        pipeline = CapitalPipeline({'main': capital}, str(journal), retries=0, backoff=0)
+        report = asyncio.run(pipeline.sweep())
+        assert report['main']['A'] == CONVERTED
+        assert report['main']['B'].startswith('FAILED')
+        runs.add(pipeline.run)
+    assert capital.converted == ['A', 'A', 'A']
+    assert len(runs) == 3
+    assert json.loads(journal.read_text()) == {'run': pipeline.run, 'done': {'main': ['A']}}
+
+
+def test_unfinished_sweep_resumes(tmp_path):
+    journal = tmp_path / 'journal.json'
+    capital = FakeCapital(['A', 'B'], failing={'B'})
+    report = asyncio.run(CapitalPipeline({'main': capital}, str(journal), backoff=0).sweep(run='day-1'))
+    assert report['main']['A'] == CONVERTED
+    assert report['main']['B'].startswith('FAILED')
+    assert json.loads(journal.read_text()) == {'run': 'day-1', 'done': {'main': ['A']}}
+
+    capital.failing.clear()
+    pipeline = CapitalPipeline({'main': capital}, str(journal), backoff=0)
+    report = asyncio.run(pipeline.sweep(run=pipeline.run))
+    assert report == {'main': {'A': DONE_BEFORE, 'B': CONVERTED}}
+    assert capital.converted == ['A', 'B']
+    assert json.loads(journal.read_text()) == {'run': 'day-1', 'done': {'main': ['A', 'B']}}
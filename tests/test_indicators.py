@@ -0,0 +1,103 @@
+import math
+import random
+import statistics
+import time
+
+import pytest
+
+from indicators import IndicatorService, SymbolIndicators
+
+WINDOW = 10
+
+
+def prices(n: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    price, result = 100.0, []
+    for _ in range(n):
+        price *= 1 + rng.uniform(-0.01, 0.01)
+        result.append(round(price, 4))
+    return result
+
+
+def test_sliding_window_matches_recomputation():
+    indicators = SymbolIndicators(ema_span=5, window=WINDOW, vwap_window=60)
+    alpha = 2 / (5 + 1)
+    series = prices(20 * WINDOW)
+    ema = None
+    for i, price in enumerate(series):
+        indicators.add(price)
+        window = series[max(0, i + 1 - WINDOW):i + 1]
+        ema = price if ema is None else alpha * price + (1 - alpha) * ema
+
+        assert indicators.mean == pytest.approx(statistics.fmean(window), rel=1e-12)
+        if len(window) > 1:
+            assert indicators.std == pytest.approx(statistics.stdev(window), rel=1e-6, abs=1e-9)
+        else:
+            assert math.isnan(indicators.std)
+        assert indicators.low == min(window)
+        assert indicators.high == max(window)
+        assert indicators.ema == pytest.approx(ema, rel=1e-12)
+        assert indicators.last == price
+    assert indicators.ticks == len(series)
+
+
+def test_window_extremes_leave_in_order():
+    indicators = SymbolIndicators(ema_span=3, window=3, vwap_window=60)
+    for price in (5, 1, 4, 3, 2, 6):
+        indicators.add(price)
+    # в окне 3, 2, 6: и минимум 1, и максимум 5 уже вышли
+    assert (indicators.low, indicators.high) == (2, 6)
+
+
+def test_vwap_expires_old_trades():
+    indicators = SymbolIndicators(ema_span=3, window=3, vwap_window=10)
+    trades = [(1000, 10.0, 1.0), (5000, 20.0, 3.0), (12000, 30.0, 2.0)]
+    assert indicators.add_trades(trades) == 3
+    assert indicators.vwap == pytest.approx((10 + 60 + 60) / 6)
+
+    indicators.expire_trades(now_ms=14000)  # окно с 4000 мс: первая сделка вышла
+    assert indicators.vwap == pytest.approx((60 + 60) / 5)
+    indicators.expire_trades(now_ms=30000)
+    assert math.isnan(indicators.vwap)
+
+
+def test_overlapping_polls_count_identical_trades_once():
+    indicators = SymbolIndicators(ema_span=3, window=3, vwap_window=60)
+    same = (2000, 10.0, 1.0)
+    # две разные сделки с одинаковыми временем, ценой и объемом - обе настоящие
+    assert indicators.add_trades([(1000, 9.0, 1.0), same, same]) == 3
+    # следующий опрос повторяет хвост прошлого ответа
+    assert indicators.add_trades([same, same]) == 0
+    # и приносит третью такую же сделку в ту же миллисекунду плюс более новую
+    assert indicators.add_trades([same, same, same, (3000, 11.0, 1.0)]) == 2
+    assert indicators.add_trades([(1000, 9.0, 1.0), (3000, 11.0, 1.0)]) == 0
+    assert indicators.vwap == pytest.approx((9 + 30 + 11) / 5)
+
+
+class Strategy:
+    def __init__(self):
+        self.calls = []
+
+    def indicators_updated(self, symbol, indicators):
+        self.calls.append((symbol, indicators.last))
+
+
+def test_service_notifies_changed_subscribed_symbols():
+    service = IndicatorService(window=WINDOW)
+    btc, everything = Strategy(), Strategy()
+    service.register_observer(btc, fields=['BTCUSDT'])
+    service.register_observer(everything)
+
+    service.price_updated({'BTCUSDT': '100', 'ETHUSDT': '10'})
+    service.price_updated({'BTCUSDT': '100', 'ETHUSDT': '11'})
+    assert btc.calls == [('BTCUSDT', 100.0)]
+    assert everything.calls == [('BTCUSDT', 100.0), ('ETHUSDT', 10.0), ('ETHUSDT', 11.0)]
+    assert service.get('BTCUSDT').ticks == 1
+
+
+def test_service_accepts_aggtrades_and_deals():
+    service = IndicatorService(vwap_window=60)
+    now = int(time.time() * 1000)
+    assert service.add_trades('BTCUSDT', [{'p': '10', 'q': '1', 'T': now - 1000}]) == 1
+    assert service.add_trades('BTCUSDT', [{'price': '20', 'qty': '1', 'time': now}]) == 1
+    assert service.get('BTCUSDT').vwap == pytest.approx(15.0)
@@ -0,0 +1,112 @@
+import asyncio
+import datetime as dt
+import json
+import time
+
+import pytest
+
+from benchmarks.fake_mexc import FakeMexcServer
+from listing_calendar import CalendarError, load_calendar
+from listing_runtime import ListingRuntime
+from mexc_toolkit import ResilientTransport, mexc_trade
+from try_mexc import PriceListener
+
+FUTURE = (dt.datetime.now() + dt.timedelta(days=1)).replace(microsecond=0).isoformat()
+
+
+def write_json(path, data) -> str:
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+@pytest.mark.parametrize('data', [
+    {'foo': 1},
+    42,
+    [1, 2],
+    [{'token': 'BTC', 'listing': FUTURE, 'duration': 'inf'}],
+    [{'token': 'BTC', 'listing': FUTURE, 'duration': 'nan'}],
+    [{'token': 'BTC', 'listing': FUTURE, 'duration': 1e300}],
+    [{'token': 'BTC', 'listing': ['not', 'a', 'date']}],
+])
+def test_broken_calendar_is_calendar_error(tmp_path, data):
+    with pytest.raises(CalendarError):
+        load_calendar(write_json(tmp_path / 'listings.json', data))
+
+
+def test_broken_reload_keeps_previous(tmp_path):
+    path = tmp_path / 'listings.json'
+
+    async def run():
+        listener = PriceListener(hosts='http://127.0.0.1')
+        runtime = ListingRuntime(listener, write_json(path, [{'token': 'BTC', 'listing': FUTURE}]))
+        assert runtime.load() == (1, 0, 0)
+        jobs = listener.scheduler.get_jobs()
+        for broken in ({'foo': 1}, 42, [{'token': 'BTC', 'listing': FUTURE, 'duration': 'inf'}]):
+            write_json(path, broken)
+            assert runtime.reload() is None
+        assert listener.scheduler.get_jobs() == jobs
+        assert len(runtime.specs) == 1
+        listener.scheduler.shutdown(wait=False)
+
+    asyncio.run(run())
+
+
+class FlakyTrade:
+    '''
+    Биржа принимает ордер, но ответ теряется - как обрыв после отправки.
+    '''
+    def __init__(self):
+        self.orders = {}
+        self.posts = 0
+
+    async def post_order(self, params):
+        self.posts += 1
+        self.orders.setdefault(params['newClientOrderId'], {'orderId': str(self.posts), **params})
+        raise ConnectionError('connection reset')
+
+    async def get_order(self, params):
+        order = self.orders.get(params['origClientOrderId'])
+        return order if order is not None else {'code': -2013, 'msg': 'Order does not exist.'}
+
+
+def spec_with_order(tmp_path, **overrides):
+    row = {'token': 'NEWT', 'listing': FUTURE, 'order_amount': 50, 'cadence': 0.01, **overrides}
+    return next(iter(load_calendar(write_json(tmp_path / 'listings.json', [row])).values()))
+
+
+def test_ambiguous_failure_does_not_duplicate_order(tmp_path):
+    spec = spec_with_order(tmp_path)
+    trade = FlakyTrade()
+    runtime = ListingRuntime(listener=None, trade=trade)
+    res = asyncio.run(runtime.place_order(spec))
+    assert res['newClientOrderId'] == ListingRuntime.client_order_id(spec)
+    assert trade.posts == 1
+    assert len(trade.orders) == 1
+
+
+def test_slow_order_does_not_block_loop(tmp_path):
+    spec = spec_with_order(tmp_path, timeout=0.1)
+
+    async def run(trade):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        task = asyncio.ensure_future(ticker())
+        start = time.monotonic()
+        res = await ListingRuntime(listener=None, trade=trade).place_order(spec)
+        task.cancel()
+        return res, ticks, time.monotonic() - start
+
+    # подписанный запрос - два обращения (время сервера + сам запрос), ~0.12 s > timeout
+    with FakeMexcServer(latency=0.06) as server:
+        trade = mexc_trade(server.url, 'key', 'secret')
+        trade.transport = ResilientTransport()
+        res, ticks, elapsed = asyncio.run(run(trade))
+        # POST не уложился в timeout, но дошел до биржи - найден по clientOrderId
+        assert res['clientOrderId'] == ListingRuntime.client_order_id(spec)
+    assert ticks > elapsed / 0.01 / 2
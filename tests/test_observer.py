@@ -0,0 +1,67 @@
+import asyncio
+import time
+
+from observer import Observer, WeatherData
+
+
+class Widget(Observer):
+    def __init__(self):
+        self.temperatures = []
+
+    def update(self, temperature, humidity, pressure) -> None:
+        self.temperatures.append(temperature)
+
+
+def burst(weather_data: WeatherData) -> None:
+    for temperature in range(5):
+        weather_data.set_measurements(temperature, 70, 30)
+
+
+def test_trailing_values_delivered_by_timer():
+    weather_data = WeatherData(coalesce_window=0.05)
+    widget = Widget()
+    weather_data.register_observer(widget)
+    burst(weather_data)
+    time.sleep(0.2)
+    assert widget.temperatures == [0, 4]
+
+
+def test_trailing_values_delivered_in_event_loop():
+    async def run():
+        weather_data = WeatherData(coalesce_window=0.05)
+        widget = Widget()
+        weather_data.register_observer(widget)
+        burst(weather_data)
+        await asyncio.sleep(0.2)
+        return widget.temperatures
+
+    assert asyncio.run(run()) == [0, 4]
+
+
+def test_timer_does_not_split_batch():
+    weather_data = WeatherData(coalesce_window=0.05)
+    widget = Widget()
+    weather_data.register_observer(widget)
+    weather_data.set_measurements(1, 1, 1)
+    weather_data.set_measurements(2, 2, 2)  # отложено до конца окна
+    with weather_data.batch():
+        weather_data.set_measurements(3, 3, 3)
+        time.sleep(0.1)  # таймер срабатывает внутри пачки
+        weather_data.set_measurements(4, 4, 4)
+    time.sleep(0.1)
+    assert widget.temperatures == [1, 4]
+
+
+def test_timer_rescheduled_after_event_loop_closed():
+    weather_data = WeatherData(coalesce_window=0.05)
+    widget = Widget()
+    weather_data.register_observer(widget)
+
+    async def run():
+        burst(weather_data)  # call_later не успевает сработать до закрытия цикла
+
+    asyncio.run(run())
+    time.sleep(0.1)
+    burst(weather_data)
+    time.sleep(0.2)
+    assert widget.temperatures == [0, 0, 4]
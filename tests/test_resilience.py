@@ -0,0 +1,149 @@
+import asyncio
+import time
+
+import pytest
+
+from benchmarks.fake_mexc import FakeMexcServer
+from mexc_toolkit import CircuitOpenError, ResilientTransport, mexc_market
+from mexc_toolkit.resilience import CircuitBreaker
+
+PRICE = {'symbol': 'BTCUSDT'}
+
+
+def make_market(server: FakeMexcServer, **options) -> mexc_market:
+    market = mexc_market(server.url)
+    market.transport = ResilientTransport(**options)
+    return market
+
+
+def other_tasks():
+    current = asyncio.current_task()
+    return [task for task in asyncio.all_tasks() if task is not current and not task.done()]
+
+
+def test_hedge_cuts_stalled_requests():
+    async def run(market):
+        stalled = 0
+        for _ in range(20):
+            start = time.monotonic()
+            res = await market.get_price(params=PRICE)
+            stalled += time.monotonic() - start >= 1.0
+            assert res['symbol'] == 'BTCUSDT'
+        return stalled
+
+    with FakeMexcServer(stall_rate=0.2, stall_time=1.0, seed=3) as server:
+        market = make_market(server, retries=0, hedge_delay=0.05)
+        stalled = asyncio.run(run(market))
+    # застревают только вызовы, у которых завис и дубль
+    assert market.transport.hedges >= 2
+    assert stalled < market.transport.hedges / 2
+
+
+def test_retries_hide_server_errors():
+    async def run(market):
+        return [(await market.get_price(params=PRICE))['symbol'] for _ in range(20)]
+
+    with FakeMexcServer(error_rate=0.3, seed=1) as server:
+        market = make_market(server, retries=6, backoff=0.001, failure_threshold=100)
+        assert asyncio.run(run(market)) == ['BTCUSDT'] * 20
+        assert server.requests_served > 20
+
+
+def test_no_retries_for_non_idempotent():
+    async def run(transport, send):
+        return await transport.request(send, '/order', idempotent=False)
+
+    calls = []
+
+    def send():
+        calls.append(1)
+        raise ConnectionError('boom')
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(run(ResilientTransport(retries=5, backoff=0.001), send))
+    assert len(calls) == 1
+
+
+def test_breaker_opens_probes_and_closes():
+    async def call(market):
+        return await market.get_price(params=PRICE)
+
+    with FakeMexcServer(error_rate=1.0) as server:
+        market = make_market(server, retries=0, hedge_delay=1.0, failure_threshold=3, reset_timeout=0.2)
+        breaker = market.transport.breaker('/api/v3/ticker/price')
+        for _ in range(3):
+            asyncio.run(call(market))
+        assert breaker.state == CircuitBreaker.OPEN
+        served = server.requests_served
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(call(market))
+        assert server.requests_served == served
+
+        # пробный запрос после reset_timeout снова упал - цепь опять открыта
+        time.sleep(0.25)
+        asyncio.run(call(market))
+        assert breaker.state == CircuitBreaker.OPEN
+
+        server.error_rate = 0.0
+        time.sleep(0.25)
+        assert asyncio.run(call(market))['symbol'] == 'BTCUSDT'
+        assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_cancelled_probe_does_not_wedge_breaker():
+    async def run(market, server, breaker):
+        for _ in range(2):
+            await market.get_price(params=PRICE)
+        assert breaker.state == CircuitBreaker.OPEN
+
+        server.error_rate, server.latency = 0.0, 0.3
+        await asyncio.sleep(0.25)
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(market.get_price(params=PRICE), 0.05)
+        assert breaker.state == CircuitBreaker.OPEN
+        assert other_tasks() == []
+
+        server.latency = 0.0
+        await asyncio.sleep(0.25)
+        assert (await market.get_price(params=PRICE))['symbol'] == 'BTCUSDT'
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    with FakeMexcServer(error_rate=1.0) as server:
+        market = make_market(server, retries=0, hedge_delay=0.01, failure_threshold=2, reset_timeout=0.2)
+        asyncio.run(run(market, server, market.transport.breaker('/api/v3/ticker/price')))
+
+
+def test_cancelled_hedge_leaves_no_tasks():
+    async def run(market):
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(market.get_price(params=PRICE), 0.1)
+        await asyncio.sleep(0)
+        return other_tasks()
+
+    with FakeMexcServer(latency=0.3) as server:
+        market = make_market(server, retries=0, hedge_delay=0.02)
+        assert asyncio.run(run(market)) == []
+        assert market.transport.hedges == 1
+
+
+def test_cancelled_call_is_not_a_failure():
+    async def run(market):
+        for _ in range(3):
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(market.get_price(params=PRICE), 0.05)
+
+    with FakeMexcServer(latency=0.2) as server:
+        market = make_market(server, retries=0, hedge_delay=1.0, failure_threshold=2)
+        asyncio.run(run(market))
+        breaker = market.transport.breaker('/api/v3/ticker/price')
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.failures == 0
+
+
+def test_stuck_request_times_out():
+    with FakeMexcServer(stall_rate=1.0, stall_time=1.0) as server:
+        market = make_market(server, connect_timeout=0.5, read_timeout=0.1)
+        start = time.monotonic()
+        with pytest.raises(Exception, match='timed out'):
+            market.public_request('GET', '/api/v3/ticker/price', params=PRICE)
+        assert time.monotonic() - start < 0.5
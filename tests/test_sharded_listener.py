@@ -0,0 +1,28 @@
+import time
+
+import pytest
+
+import sharded_listener
+from sharded_listener import SharedPriceSnapshot
+
+
+def test_slot_abandoned_mid_write_does_not_hang(monkeypatch):
+    monkeypatch.setattr(sharded_listener, '_READ_TIMEOUT', 0.05)
+    owner = SharedPriceSnapshot(['BTCUSDT', 'ETHUSDT'])
+    reader = SharedPriceSnapshot.attach(owner.name, owner.symbols)
+    try:
+        owner.write(0, 100.0, ts=1.0)
+        owner.seq[1] += 1  # писатель убит между двумя сохранениями seq
+
+        start = time.monotonic()
+        with pytest.raises(TimeoutError):
+            reader.read(1)
+        assert time.monotonic() - start < 1.0
+        assert reader['BTCUSDT'] == 100.0
+
+        assert owner.repair() == 1
+        assert reader.read(1) == (0.0, 0.0)
+        assert owner.repair() == 0
+    finally:
+        reader.close()
+        owner.close()
@@ -0,0 +1,86 @@
+import pytest
+
+from spread_scanner import SpreadScanner
+
+EXCHANGE_INFO = {'symbols': [
+    {'symbol': 'BTCUSDT', 'baseAsset': 'BTC', 'quoteAsset': 'USDT', 'status': '1'},
+    {'symbol': 'ETHBTC', 'baseAsset': 'ETH', 'quoteAsset': 'BTC', 'status': '1'},
+    {'symbol': 'ETHUSDT', 'baseAsset': 'ETH', 'quoteAsset': 'USDT', 'status': '1'},
+    {'symbol': 'MXBTC', 'baseAsset': 'MX', 'quoteAsset': 'BTC', 'status': '2'},  # выключена
+    {'symbol': 'MXUSDT', 'baseAsset': 'MX', 'quoteAsset': 'USDT', 'status': '1'},
+]}
+
+FORWARD = ('USDT', 'BTC', 'ETH', 'USDT')
+BACKWARD = ('USDT', 'ETH', 'BTC', 'USDT')
+
+
+def book(ethusdt_bid: float = 5.2) -> list:
+    return [
+        {'symbol': 'BTCUSDT', 'bidPrice': '100', 'askPrice': '101'},
+        {'symbol': 'ETHBTC', 'bidPrice': '0.05', 'askPrice': '0.051'},
+        {'symbol': 'ETHUSDT', 'bidPrice': str(ethusdt_bid), 'askPrice': '5.3'},
+        {'symbol': 'UNKNOWN', 'bidPrice': '1', 'askPrice': '1'},
+    ]
+
+
+class Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def spread_found(self, opportunities):
+        self.calls.append(opportunities)
+
+
+def returns(scanner: SpreadScanner) -> dict:
+    return dict(zip(scanner.paths, scanner.evaluate()))
+
+
+def test_paths_use_bid_to_sell_and_inverse_ask_to_buy():
+    scanner = SpreadScanner(EXCHANGE_INFO)
+    # MX -> BTC выключена, поэтому треугольника через MX нет
+    assert sorted(scanner.paths) == sorted([FORWARD, BACKWARD])
+    symbols = dict(zip(scanner.paths, scanner.path_symbols))
+    assert symbols[FORWARD] == ('BTCUSDT', 'ETHBTC', 'ETHUSDT')
+    assert symbols[BACKWARD] == ('ETHUSDT', 'ETHBTC', 'BTCUSDT')
+
+    scanner.update(book())
+    result = returns(scanner)
+    # USDT -> BTC по ask, BTC -> ETH по ask, ETH -> USDT по bid
+    assert result[FORWARD] == pytest.approx(1 / 101 * (1 / 0.051) * 5.2)
+    # USDT -> ETH по ask, ETH -> BTC по bid, BTC -> USDT по bid
+    assert result[BACKWARD] == pytest.approx(1 / 5.3 * 0.05 * 100)
+
+
+def test_fee_applies_to_every_leg():
+    scanner = SpreadScanner(EXCHANGE_INFO, fee=0.001)
+    scanner.update(book())
+    assert returns(scanner)[FORWARD] == pytest.approx(1 / 101 / 0.051 * 5.2 * 0.999 ** 3)
+
+
+def test_zero_ask_makes_path_worthless():
+    scanner = SpreadScanner(EXCHANGE_INFO)
+    broken = book()
+    broken[1]['askPrice'] = '0'
+    scanner.update(broken)
+    assert returns(scanner)[FORWARD] == 0.0
+
+
+def test_scan_notifies_only_on_upward_crossing():
+    scanner = SpreadScanner(EXCHANGE_INFO, threshold=0.005)
+    recorder = Recorder()
+    scanner.register_observer(recorder)
+
+    scanner.update(book())
+    opportunities = scanner.scan()
+    assert [(path, symbols) for path, symbols, _ in opportunities] == [
+        (FORWARD, ('BTCUSDT', 'ETHBTC', 'ETHUSDT')),
+    ]
+    assert opportunities[0][2] == pytest.approx(5.2 / (101 * 0.051) - 1)
+    assert recorder.calls == [opportunities]
+
+    assert scanner.scan() == []  # все еще выше порога - не новое пересечение
+    scanner.update(book(ethusdt_bid=5.0))
+    assert scanner.scan() == []  # ушло ниже порога
+    scanner.update(book())
+    assert len(scanner.scan()) == 1  # снова пересекло вверх
+    assert len(recorder.calls) == 2
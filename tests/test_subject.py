@@ -0,0 +1,146 @@
+import asyncio
+import gc
+
+import pytest
+
+from subject import Subject
+
+
+class Recorder:
+    def __init__(self, log, name):
+        self.log = log
+        self.name = name
+
+    def update(self, *args, **kwargs) -> None:
+        self.log.append((self.name, args, kwargs))
+
+
+class Remover(Recorder):
+    def __init__(self, log, name, subject, victim):
+        super().__init__(log, name)
+        self.subject = subject
+        self.victim = victim
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        self.subject.remove_observer(self.victim)
+
+
+class AsyncRecorder(Recorder):
+    async def update(self, *args, **kwargs) -> None:
+        await asyncio.sleep(0)
+        self.log.append((self.name, args, kwargs))
+
+
+def names(log) -> list:
+    return [name for name, _, _ in log]
+
+
+def test_dead_observer_is_forgotten():
+    log = []
+    subject = Subject()
+    first, second = Recorder(log, 'first'), Recorder(log, 'second')
+    subject.register_observer(first)
+    subject.register_observer(second)
+    subject.notify_observers(1)  # снимок собран до смерти наблюдателя
+
+    del first
+    gc.collect()
+    assert subject.observers() == [second]
+    subject.notify_observers(2)
+    assert log == [('first', (1,), {}), ('second', (1,), {}), ('second', (2,), {})]
+
+
+def test_reregistered_observer_dies_once():
+    log = []
+    subject = Subject()
+    observer = Recorder(log, 'observer')
+    subject.register_observer(observer)
+    subject.register_observer(observer)  # у старой слабой ссылки тоже сработает callback
+    subject.notify_observers()
+    assert names(log) == ['observer']
+
+    del observer
+    gc.collect()
+    assert subject.observers() == []
+
+
+def test_recycled_id_is_a_fresh_registration():
+    log = []
+    subject = Subject()
+    dead = Recorder(log, 'dead')
+    key = id(dead)
+    subject.register_observer(dead, fields=('price',))
+    del dead
+    gc.collect()
+
+    # CPython почти сразу отдает освобожденную память объекту того же размера
+    candidates = [Recorder(log, 'fresh') for _ in range(1000)]
+    fresh = next((candidate for candidate in candidates if id(candidate) == key), None)
+    if fresh is None:
+        pytest.skip('id() was not recycled')
+    del candidates
+
+    assert subject.observers() == []
+    subject.register_observer(fresh)
+    subject.notify_changed(('volume',))
+    assert names(log) == ['fresh']
+
+
+def test_removal_during_notification():
+    log = []
+    subject = Subject()
+    victim = Recorder(log, 'victim')
+    remover = Remover(log, 'remover', subject, victim)
+    subject.register_observer(remover)
+    subject.register_observer(victim)
+    late = Recorder(log, 'late')
+    subject.register_observer(late)
+
+    subject.notify_observers()
+    assert names(log) == ['remover', 'late']
+    assert subject.observers() == [remover, late]
+
+    with pytest.raises(ValueError):
+        subject.remove_observer(victim)
+
+
+def test_notify_changed_filters_by_field():
+    log = []
+    subject = Subject()
+    everything = Recorder(log, 'everything')
+    price = Recorder(log, 'price')
+    volume = Recorder(log, 'volume')
+    subject.register_observer(everything)
+    subject.register_observer(price, fields=('price',))
+    subject.register_observer(volume, fields=('volume', 'depth'))
+
+    subject.notify_changed(('price',), 1)
+    assert names(log) == ['everything', 'price']
+    log.clear()
+    subject.notify_changed(('depth', 'bid'), 2)
+    assert names(log) == ['everything', 'volume']
+    log.clear()
+    subject.notify_changed(('bid',), 3)
+    assert names(log) == ['everything']
+    log.clear()
+    subject.notify_changed(None, 4)
+    assert names(log) == ['everything', 'price', 'volume']
+
+    subject.remove_observer(price)
+    log.clear()
+    subject.notify_changed(('price',), 5)
+    assert names(log) == ['everything']
+
+
+def test_notify_observers_async_awaits_coroutines():
+    log = []
+    subject = Subject()
+    sync, coro = Recorder(log, 'sync'), AsyncRecorder(log, 'async')
+    other = AsyncRecorder(log, 'other')
+    subject.register_observer(coro, fields=('price',))
+    subject.register_observer(sync)
+    subject.register_observer(other, fields=('volume',))
+
+    asyncio.run(subject.notify_observers_async(7, changed=('price',), side='buy'))
+    assert sorted(log) == [('async', (7,), {'side': 'buy'}), ('sync', (7,), {'side': 'buy'})]
@@ -0,0 +1,36 @@
+import os
+
+from tick_recorder import ColumnFile, TickRecorder, _GROW
+
+
+def open_fds() -> int:
+    return len(os.listdir('/proc/self/fd'))
+
+
+def test_columns_are_sparse_and_hold_at_most_one_fd(tmp_path):
+    before = open_fds()
+    recorder = TickRecorder(str(tmp_path))
+    for i in range(100):
+        recorder.record(f'S{i}USDT', 1.0, ts=0.0)
+    # по дескриптору на mmap колонки (на Python 3.13+ - ни одного), файлы закрыты
+    assert open_fds() - before <= 2 * 100
+
+    price = os.stat(tmp_path / 'S0USDT' / 'price.f64')
+    assert price.st_blocks * 512 < price.st_size // 8
+    recorder.close()
+    assert open_fds() == before
+
+
+def test_column_grows_and_reopens(tmp_path):
+    path = str(tmp_path / 'price.f64')
+    column = ColumnFile(path)
+    for i in range(_GROW + 10):
+        column.append(float(i))
+    column.close()
+
+    column = ColumnFile(path, writable=False)
+    values = column.values()
+    assert column.count == _GROW + 10
+    assert values[0] == 0.0 and values[-1] == float(_GROW + 9)
+    del values
+    column.close()
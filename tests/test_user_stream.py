@@ -0,0 +1,47 @@
+import json
+
+from order_tracker import OrderTracker
+from user_stream import ORDERS, StreamObserver, UserDataStream
+
+
+class Recorder:
+    def __init__(self):
+        self.transitions = []
+
+    def order_updated(self, order, previous_status):
+        self.transitions.append((previous_status, order['status']))
+
+
+class Broken(StreamObserver):
+    def stream_event(self, channel, message):
+        raise KeyError('boom')
+
+
+def order_event(status: int) -> str:
+    return json.dumps({'c': ORDERS, 's': 'BTCUSDT', 'd': {'i': '1', 'c': 'cid', 's': status, 'cv': '1'}})
+
+
+def test_stale_snapshot_does_not_reopen_closed_order():
+    stream = UserDataStream(listenkey=None)
+    tracker = OrderTracker(stream, trade=None)
+    recorder = Recorder()
+    tracker.register_observer(recorder)
+
+    stream.dispatch(order_event(1))
+    stream.dispatch(order_event(2))  # FILLED пришел по потоку, пока шел get_openorders
+    tracker.track({'orderId': '1', 'symbol': 'BTCUSDT', 'status': 'NEW', 'executedQty': '0'})
+
+    assert tracker.get('1')['status'] == 'FILLED'
+    assert tracker.open_orders() == []
+    assert recorder.transitions == [(None, 'NEW'), ('NEW', 'FILLED')]
+
+
+def test_bad_frames_and_observer_errors_do_not_escape():
+    stream = UserDataStream(listenkey=None)
+    broken = Broken()
+    stream.register_observer(broken)  # падает раньше, чем до события доходит трекер
+    tracker = OrderTracker(stream, trade=None)
+
+    for raw in ('not json', '[1, 2]', json.dumps({'c': ORDERS, 'd': {}}), order_event(1), order_event(2)):
+        stream.dispatch(raw)
+    assert tracker.get('1')['status'] == 'FILLED'
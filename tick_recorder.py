@@ -0,0 +1,203 @@
+# Tick recorder (Observer) and replay (Subject) over memory-mapped columnar files
+
+import asyncio
+import heapq
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Dict, Iterable, List, Optional
+
+from loguru import logger
+
+from subject import Subject
+from try_mexc import Observer
+
+'''
+Все, что видят PriceListener и Listing, пропадает после выхода процесса.
+TickRecorder - наблюдатель, который дописывает тики в файлы на диске:
+
+    <root>/<SYMBOL>/ts.f64     - время тика, time.time()
+    <root>/<SYMBOL>/price.f64  - цена
+
+Каждый файл - колонка float64 с заголовком из 8 байт (uint64 - число записей).
+Файл отображается в память (mmap) и растет блоками, fsync - не чаще fsync_interval.
+TickReplay - субъект, который проигрывает записанное наблюдателям в N раз быстрее
+реального времени или так быстро, как получится (speed=None).
+'''
+
+_HEADER = struct.Struct('<Q')
+_VALUE = 8
+_GROW = 65536  # записей на один шаг роста файла
+_MMAP_OPTIONS = {'trackfd': False} if sys.version_info >= (3, 13) else {}
+
+
+class ColumnFile:
+    def __init__(self, path: str, writable: bool = True):
+        self.path = path
+        self.writable = writable
+        if writable and not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.truncate(_HEADER.size + _GROW * _VALUE)  # разреженный файл, нули не пишем
+        self.__map = self.__mmap()
+        self.count = _HEADER.unpack_from(self.__map, 0)[0]
+
+    def __mmap(self, size: Optional[int] = None) -> mmap.mmap:
+        # файл закрывается сразу: на колонку остается только дескриптор самого mmap
+        # (а с Python 3.13 - ни одного), иначе ulimit кончается на паре сотен символов
+        access = mmap.ACCESS_WRITE if self.writable else mmap.ACCESS_READ
+        with open(self.path, 'r+b' if self.writable else 'rb') as f:
+            if size is not None:
+                f.truncate(size)
+            return mmap.mmap(f.fileno(), 0, access=access, **_MMAP_OPTIONS)
+
+    @property
+    def capacity(self) -> int:
+        return (len(self.__map) - _HEADER.size) // _VALUE
+
+    def __grow(self) -> None:
+        size = len(self.__map) + _GROW * _VALUE
+        self.__map.flush()
+        self.__map.close()
+        self.__map = self.__mmap(size)
+
+    def append(self, value: float) -> None:
+        if self.count >= self.capacity:
+            self.__grow()
+        struct.pack_into('<d', self.__map, _HEADER.size + self.count * _VALUE, value)
+        self.count += 1
+        _HEADER.pack_into(self.__map, 0, self.count)
+
+    def values(self) -> memoryview:
+        # Без копирования: view поверх отображенного файла
+        return memoryview(self.__map)[_HEADER.size:_HEADER.size + self.count * _VALUE].cast('d')
+
+    def flush(self) -> None:
+        self.__map.flush()
+
+    def close(self) -> None:
+        if self.writable:
+            self.__map.flush()
+        self.__map.close()
+
+
+class TickRecorder(Observer):
+    def __init__(self, root: str, subject: Optional[Subject] = None, fsync_interval: float = 1.0):
+        self.root = root
+        self.fsync_interval = fsync_interval
+        self.__columns: Dict[str, Dict[str, ColumnFile]] = {}
+        self.__last: Dict[str, float] = {}
+        self.__synced = time.monotonic()
+        os.makedirs(root, exist_ok=True)
+        if subject is not None:
+            subject.register_observer(self)
+
+    def __symbol_columns(self, symbol: str) -> Dict[str, ColumnFile]:
+        columns = self.__columns.get(symbol)
+        if columns is None:
+            folder = os.path.join(self.root, symbol)
+            os.makedirs(folder, exist_ok=True)
+            columns = {name: ColumnFile(os.path.join(folder, f'{name}.f64')) for name in ('ts', 'price')}
+            self.__columns[symbol] = columns
+        return columns
+
+    def record(self, symbol: str, price: float, ts: Optional[float] = None) -> None:
+        columns = self.__symbol_columns(symbol)
+        columns['ts'].append(time.time() if ts is None else ts)
+        columns['price'].append(price)
+        if time.monotonic() - self.__synced >= self.fsync_interval:
+            self.sync()
+
+    def price_updated(self, data) -> None:
+        # Субъект присылает весь словарь цен - пишем только изменившиеся символы
+        now = time.time()
+        for symbol, price in data.items():
+            price = float(price)
+            if self.__last.get(symbol) != price:
+                self.__last[symbol] = price
+                self.record(symbol, price, now)
+
+    # sandbox.Listing оповещает через update(data)
+    update = price_updated
+
+    def sync(self) -> None:
+        for columns in self.__columns.values():
+            for column in columns.values():
+                column.flush()
+        self.__synced = time.monotonic()
+
+    def close(self) -> None:
+        for columns in self.__columns.values():
+            for column in columns.values():
+                column.close()
+        self.__columns.clear()
+
+
+def recorded_symbols(root: str) -> List[str]:
+    return sorted(
+        name for name in os.listdir(root)
+        if os.path.exists(os.path.join(root, name, 'ts.f64'))
+    )
+
+
+class TickReplay(Subject):
+    '''
+    Проигрывает записанные тики в порядке времени по всем символам.
+    Наблюдатели получают тот же словарь {symbol: price}, что и от PriceListener.
+    '''
+    notify_method = 'price_updated'
+
+    def __init__(self, root: str, symbols: Optional[Iterable[str]] = None):
+        super().__init__()
+        self.__data: Dict[str, float] = {}
+        self.__symbols = list(symbols) if symbols is not None else recorded_symbols(root)
+        self.__columns = {
+            symbol: (
+                ColumnFile(os.path.join(root, symbol, 'ts.f64'), writable=False),
+                ColumnFile(os.path.join(root, symbol, 'price.f64'), writable=False),
+            )
+            for symbol in self.__symbols
+        }
+
+    def notify_users(self) -> None:
+        self.notify_observers(self.__data)
+
+    def __ticks(self):
+        streams = []
+        for symbol, (ts_column, price_column) in self.__columns.items():
+            streams.append(zip(ts_column.values(), (symbol,) * ts_column.count, price_column.values()))
+        return heapq.merge(*streams)
+
+    def run(self) -> int:
+        # Так быстро, как получится; возвращает число проигранных тиков
+        data, notify = self.__data, self.notify_observers
+        count = 0
+        for _, symbol, price in self.__ticks():
+            data[symbol] = price
+            notify(data)
+            count += 1
+        return count
+
+    async def replay(self, speed: Optional[float] = None) -> int:
+        if speed is None:
+            return self.run()
+        count = 0
+        started = time.monotonic()
+        first_ts = None
+        for ts, symbol, price in self.__ticks():
+            if first_ts is None:
+                first_ts = ts
+            delay = (ts - first_ts) / speed - (time.monotonic() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.__data[symbol] = price
+            self.notify_users()
+            count += 1
+        logger.debug(f'Replayed {count} ticks at x{speed}')
+        return count
+
+    def close(self) -> None:
+        for ts_column, price_column in self.__columns.values():
+            ts_column.close()
+            price_column.close()
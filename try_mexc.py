@@ -3,27 +3,15 @@
 import asyncio
 import datetime as dt
 from abc import ABC, abstractmethod
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from typing import List, Dict
+from typing import Dict, Optional
+# loguru (~20 мс импорта) не откладываем: main настраивает его первым делом, а модули,
+# которые импортируют этот файл, импортируют loguru и сами
 from loguru import logger
 
-from mexc_toolkit import mexc_market
+from mexc_toolkit import CircuitOpenError, mexc_market
+from subject import Subject
 
-from config import TIMING, STABLE, RESPONSE_MAX_TIME
-
-
-class Subject(ABC):
-    @abstractmethod
-    def register_observer(self, observer) -> None:
-        pass
-
-    @abstractmethod
-    def remove_observer(self, observer) -> None:
-        pass
-
-    @abstractmethod
-    def notify_users(self) -> None:
-        pass
+from config import TIMING, TIMEZONE, STABLE, RESPONSE_MAX_TIME
 
 
 class Observer(ABC):
@@ -33,33 +21,35 @@ class Observer(ABC):
 
 
 class PriceListener(Subject):
-    def __init__(self):
-        self.__users: List[Observer] = []
+    notify_method = 'price_updated'
+
+    def __init__(self, hosts='https://api.mexc.com', duration=TIMING['price_check']):
+        super().__init__()
         self.__data: Dict[str, float] = {}
-        self.__mexc = mexc_market('https://api.mexc.com')
-        self.__duration = TIMING['price_check']
-        self.scheduler = AsyncIOScheduler({'apscheduler.timezone': 'Europe/Moscow'})
+        self.__mexc = mexc_market(hosts)
+        self.__duration = duration
+        # APScheduler (~0.1 s на импорт) нужен только работающему слушателю
+        from apscheduler.schedulers.asyncio import AsyncIOScheduler
+        self.scheduler = AsyncIOScheduler({'apscheduler.timezone': TIMEZONE})
         self.scheduler.start()
 
-    def register_observer(self, observer) -> None:
-        self.__users.append(observer)
-
-    def remove_observer(self, observer) -> None:
-        self.__users.remove(observer)
-
     def notify_users(self) -> None:
-        for user in self.__users:
-            user.price_updated(self.__data)
+        self.notify_observers(self.__data)
 
-    def add_token(self, token, listing):
+    def add_token(self, token, listing, job_id: Optional[str] = None, stable: str = STABLE, **overrides):
+        '''
+        overrides - duration, cadence и timeout для этого листинга (см. fetch_price).
+        '''
         logger.debug(f'Adding token {token} to Listener')
-        symbol = token + STABLE
-        self.scheduler.add_job(
+        symbol = token + stable
+        return self.scheduler.add_job(
             self.fetch_price,
             'date',
+            id=job_id,
             run_date=listing,
             misfire_grace_time=5,
-            kwargs={'symbol': symbol},
+            replace_existing=job_id is not None,
+            kwargs={'symbol': symbol, **overrides},
         )
 
     def remove_token(self, token):
@@ -67,28 +57,32 @@ class PriceListener(Subject):
         symbol = token + STABLE
         jobs = self.scheduler.get_jobs()
         for job in jobs:
-            if token in job.kwargs['symbol']:
+            if token in job.kwargs.get('symbol', ''):
                 self.scheduler.remove_job(job.id)
-        del self.__data[symbol]
+        self.__data.pop(symbol, None)
 
     def data_changed(self) -> None:
         self.notify_users()
 
-    async def fetch_price(self, symbol) -> None:
-        timelimit = dt.datetime.now() + dt.timedelta(seconds=self.__duration)
+    async def fetch_price(self, symbol, duration: Optional[float] = None,
+                          cadence: float = TIMING['price_cadence'], timeout: float = RESPONSE_MAX_TIME) -> None:
+        duration = self.__duration if duration is None else duration
+        timelimit = dt.datetime.now() + dt.timedelta(seconds=duration)
         while dt.datetime.now() <= timelimit:
             try:
                 res = await asyncio.wait_for(
                     self.__mexc.get_price(params={'symbol': symbol}),
-                    timeout=RESPONSE_MAX_TIME,
+                    timeout=timeout,
                 )
                 self.__data[symbol] = res['price']
                 self.notify_users()
             except asyncio.TimeoutError:
-                print('TIMEOUT while MEXC price waiting!')
+                logger.warning(f'TIMEOUT while MEXC price waiting for {symbol}')
+            except CircuitOpenError as e:
+                logger.warning(f'{e}, skipping {symbol}')
             except Exception as e:
-                print(f'Error: ')
-            await asyncio.sleep(RESPONSE_MAX_TIME)
+                logger.error(f'Error while fetching {symbol}: {e!r}')
+            await asyncio.sleep(cadence)
 
 
 class User(Observer):
@@ -0,0 +1,139 @@
+# MEXC private user-data WebSocket as a Subject
+
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import Optional, Sequence
+
+import websockets
+from loguru import logger
+
+from mexc_toolkit import mexc_listenkey
+from subject import Subject
+
+'''
+Приватный поток MEXC: ListenKey берется через mexc_listenkey.post_listenKey,
+продлевается в фоне put_listenKey, а события ордеров, сделок и баланса приходят
+по WebSocket. Наблюдатели получают stream_event(channel, message).
+
+После переподключения поток сначала шлет событие RECONNECTED (message = None) -
+наблюдатели, которые держат состояние (ордера, балансы), должны сверить его с REST.
+'''
+
+WS_URL = 'wss://wbs.mexc.com/ws'
+ORDERS = 'spot@private.orders.v3.api'
+DEALS = 'spot@private.deals.v3.api'
+ACCOUNT = 'spot@private.account.v3.api'
+RECONNECTED = 'reconnected'
+
+KEEPALIVE = 30 * 60  # ListenKey живет 60 минут
+PING = 20
+RECONNECT_DELAY = 1
+
+
+class StreamObserver(ABC):
+    @abstractmethod
+    def stream_event(self, channel: str, message: Optional[dict]) -> None:
+        pass
+
+
+class UserDataStream(Subject):
+    notify_method = 'stream_event'
+
+    def __init__(self, listenkey: mexc_listenkey, ws_url: str = WS_URL,
+                 channels: Sequence[str] = (ORDERS, DEALS, ACCOUNT)):
+        super().__init__()
+        self.__listenkey = listenkey
+        self.__ws_url = ws_url
+        self.__channels = list(channels)
+        self.__key: Optional[str] = None
+        self.__running = False
+        self.__ws = None
+        self.connections = 0
+
+    async def __new_key(self) -> str:
+        res = await asyncio.to_thread(self.__listenkey.post_listenKey)
+        return res['listenKey']
+
+    async def __keepalive(self) -> None:
+        while self.__running:
+            await asyncio.sleep(KEEPALIVE)
+            try:
+                await asyncio.to_thread(self.__listenkey.put_listenKey, {'listenKey': self.__key})
+                logger.debug('ListenKey extended')
+            except Exception as e:
+                logger.error(f'ListenKey keepalive failed: {e!r}')
+
+    async def __ping(self, ws) -> None:
+        while True:
+            await asyncio.sleep(PING)
+            await ws.send(json.dumps({'method': 'PING'}))
+
+    @staticmethod
+    def _call(entries, args, kwargs) -> None:
+        # ошибка одного наблюдателя не должна лишать событие остальных и рвать поток
+        for ref, func, _ in entries:
+            observer = ref()
+            if observer is not None:
+                try:
+                    func(observer, *args, **kwargs)
+                except Exception as e:
+                    logger.error(f'{observer!r} failed on {args[0]}: {e!r}')
+
+    def dispatch(self, raw) -> None:
+        try:
+            message = json.loads(raw)
+        except ValueError as e:
+            logger.error(f'User data stream message is not JSON: {e!r}, raw: {raw!r:.200}')
+            return
+        channel = message.get('c') if isinstance(message, dict) else None
+        if channel and 'd' in message:
+            self.notify_observers(channel, message)
+
+    async def __session(self) -> None:
+        async with websockets.connect(f'{self.__ws_url}?listenKey={self.__key}') as ws:
+            self.__ws = ws
+            await ws.send(json.dumps({'method': 'SUBSCRIPTION', 'params': self.__channels}))
+            self.connections += 1
+            if self.connections > 1:
+                self.notify_observers(RECONNECTED, None)
+            logger.debug(f'User data stream connected ({self.connections})')
+            ping = asyncio.create_task(self.__ping(ws))
+            try:
+                async for raw in ws:
+                    self.dispatch(raw)
+            finally:
+                ping.cancel()
+                self.__ws = None
+
+    async def run(self) -> None:
+        self.__running = True
+        self.__key = await self.__new_key()
+        keepalive = asyncio.create_task(self.__keepalive())
+        try:
+            while self.__running:
+                try:
+                    await self.__session()
+                except (OSError, websockets.WebSocketException) as e:
+                    logger.warning(f'User data stream dropped: {e!r}')
+                except Exception as e:
+                    logger.error(f'User data stream failed: {e!r}')
+                if not self.__running:
+                    break
+                await asyncio.sleep(RECONNECT_DELAY)
+                try:
+                    # продлеваем старый ключ, а если он уже истек - берем новый
+                    res = await asyncio.to_thread(self.__listenkey.put_listenKey, {'listenKey': self.__key})
+                    if 'listenKey' not in res:
+                        self.__key = await self.__new_key()
+                except Exception as e:
+                    logger.error(f'ListenKey refresh failed: {e!r}')
+        finally:
+            keepalive.cancel()
+
+    async def stop(self) -> None:
+        self.__running = False
+        if self.__ws is not None:
+            await self.__ws.close()
+        if self.__key is not None:
+            await asyncio.to_thread(self.__listenkey.delete_listenKey, {'listenKey': self.__key})